@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class AssetLoader:
+    def __init__(self, workers=2):
+        """Loads assets on worker threads; results are handed over on the main thread by poll()"""
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self.jobs = []  # [name, future, finish, weight, steps] in submission order
+        self.building = []  # [name, step generator, weight] of stepped finishes still running
+        self.assets = {}
+        self.total_weight = 0
+        self.done_weight = 0
+
+    def add(self, name, load, *args, finish=None, weight=1, steps=False):
+        """Run load(*args) on a worker; finish(result) later runs on the main thread and its return value is stored.
+
+        With steps=True, finish returns a generator that poll() runs a few steps per frame; what it
+        returns is stored. Jobs that share mutable state (e.g. a random stream) must be a single job
+        so their order stays fixed.
+        """
+        future = self.executor.submit(load, *args)
+        self.jobs.append([name, future, finish, weight, steps])
+        self.total_weight += weight
+
+    def poll(self, budget_ms=float("inf")):
+        """Finish every job whose worker is done, running stepped finishes for up to about `budget_ms`.
+
+        Call once per frame on the main thread.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000  # Plain finishes count against the budget too
+        pending = []
+        for job in self.jobs:
+            name, future, finish, weight, steps = job
+            if not future.done():
+                pending.append(job)
+                continue
+            # A failed load raises here, on the main thread, just as a synchronous load would
+            result = future.result()
+            if steps:
+                self.building.append([name, finish(result), weight])
+                continue
+            self.assets[name] = finish(result) if finish else result
+            self.done_weight += weight
+        self.jobs = pending
+        if not self.jobs:
+            self.executor.shutdown(wait=False)
+
+        while self.building and time.perf_counter() < deadline:
+            name, steps, weight = self.building[0]
+            try:
+                next(steps)
+            except StopIteration as done:
+                self.assets[name] = done.value
+                self.done_weight += weight
+                self.building.pop(0)
+        return self.done
+
+    def wait(self):
+        """Block until everything is loaded (headless runs, or leaving the intro early)"""
+        for name, future, finish, weight, steps in self.jobs:
+            future.result()
+        self.poll()
+
+    def close(self):
+        """Drop jobs that haven't started and wait for the running ones"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def done(self):
+        return not self.jobs and not self.building
+
+    @property
+    def progress(self):
+        """Fraction of the queued work (by weight) that has been handed over"""
+        return self.done_weight / self.total_weight if self.total_weight else 1.0
+
+    def get(self, name):
+        return self.assets[name]
@@ -1,5 +1,4 @@
 #!/usr/bin/env python3
-import boto3
 import json
 import uuid
 import os
@@ -11,7 +10,8 @@ class LeaderboardManager:
         self.table_name = table_name
         self.region = region
         
-        # Initialize DynamoDB client
+        # Initialize DynamoDB client (boto3 is slow to import, so only when a leaderboard is used)
+        import boto3
         self.dynamodb = boto3.resource('dynamodb', region_name=region)
         self.table = None
         
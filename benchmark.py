@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Scripted macro-benchmarks for the full game loop.
+
+Drives Game through fixed, seeded scenarios on the SDL dummy video/audio
+drivers: simulation, drawing and display flip, but no clock cap. Each
+scenario reports throughput and frame-time percentiles, overall and per
+phase, as JSON so runs from different builds can be compared.
+
+    python benchmark.py --output bench.json
+    python benchmark.py --baseline bench.json --tolerance 0.15
+    python benchmark.py --replay run.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+
+# SDL drivers must be chosen before pygame is initialised
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from profiler import FrameProfiler
+from sector_cache import SECTOR_CACHE_BYTES
+from input_log import InputPlayback
+
+SCREEN_WIDTH = 1280
+SCREEN_HEIGHT = 720
+FRAME_TIME = 1.0 / 60  # Simulated time per rendered frame
+DEFAULT_SEED = 2025
+
+
+class Scenario:
+    def __init__(self, name, description, frames=600, warmup=60):
+        """One scripted benchmark run; subclasses override setup/before_frame"""
+        self.name = name
+        self.description = description
+        self.frames = frames
+        self.warmup = warmup  # Frames run before measuring starts
+        self.playback = None  # Recorded input driving the run, if any
+        self.keep_alive = True  # Refill mental health so the run lasts all its frames
+
+    def setup(self, game):
+        pass
+
+    def before_frame(self, game, frame):
+        pass
+
+
+class SteadyState(Scenario):
+    def __init__(self, frames=600, warmup=60):
+        super().__init__("steady_state", "Normal play with regular spawns", frames, warmup)
+
+
+class RecruiterBurst(Scenario):
+    def __init__(self, bots=50, frames=600, warmup=60):
+        super().__init__("recruiter_burst", f"{bots} recruiter bots on screen firing projectiles", frames, warmup)
+        self.bots = bots
+
+    def setup(self, game):
+        from obstacles_enhanced import Obstacle
+
+        for i in range(self.bots):
+            bot = game.pools.acquire("recruiter_bot", Obstacle, "recruiter_bot", i % 3, game.speed,
+                                     game.sprite_manager, game.particle_system)
+            bot.game_ref = game
+            # Spread across the screen and crawl slowly so they stay in view
+            bot.x = bot.prev_x = float(300 + (i * 53) % (game.width - 300))
+            bot.rect.x = round(bot.x)
+            bot.speed = 10
+            bot.shoot_timer = (i / self.bots) * bot.shoot_interval  # Stagger the volleys
+            game.obstacles.add(bot)
+
+
+class ParticleStorm(Scenario):
+    def __init__(self, hits_per_frame=3, frames=600, warmup=60):
+        super().__init__("particle_storm", f"take_damage {hits_per_frame}x per frame", frames, warmup)
+        self.hits_per_frame = hits_per_frame
+
+    def before_frame(self, game, frame):
+        for _ in range(self.hits_per_frame):
+            game.player.take_damage(5)
+
+
+class SectorTransitions(Scenario):
+    def __init__(self, every=10, frames=300, warmup=10):
+        super().__init__("sector_transitions", f"Sector transition every {every} frames", frames, warmup)
+        self.every = every
+
+    def before_frame(self, game, frame):
+        if frame % self.every == 0:
+            # Push the score over the threshold; update_playing rebuilds the background
+            game.player.score = game.sector_transition_score + 1
+
+
+class Replay(Scenario):
+    def __init__(self, path):
+        playback = InputPlayback.load(path)
+        frames = max(1, round(playback.ticks / playback.sim_hz / FRAME_TIME))
+        super().__init__(f"replay:{os.path.basename(path)}", f"Recorded input from {path}", frames, warmup=0)
+        self.path = path
+        self.playback = playback
+        self.keep_alive = False  # Play the recording exactly as it happened
+
+
+SCENARIOS = [SteadyState(), RecruiterBurst(), ParticleStorm(), SectorTransitions()]
+
+
+def create_benchmark_game(width=SCREEN_WIDTH, height=SCREEN_HEIGHT, seed=DEFAULT_SEED, playback=None,
+                          background_cache_bytes=SECTOR_CACHE_BYTES):
+    """Create a Game drawing to a dummy display, starting in PLAYING"""
+    from game_enhanced import Game, GameState
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((width, height))
+    game = Game(screen, pygame.time.Clock(), audio_available=False, seed=seed, playback=playback,
+                background_cache_bytes=background_cache_bytes)
+    game.state = GameState.PLAYING
+    game.player_name = "Benchmark"
+    return game
+
+
+def summarize(values):
+    """Mean/min/max and p50/p95/p99 of a list of ms timings"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    summary = {
+        "mean": sum(ordered) / len(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+    for p in (50, 95, 99):
+        summary[f"p{p}"] = ordered[min(last, int(round(p / 100 * last)))]
+    return {key: round(value, 3) for key, value in summary.items()}
+
+
+def run_scenario(scenario, seed=DEFAULT_SEED, background_cache_bytes=SECTOR_CACHE_BYTES):
+    """Run one scenario on a fresh game and return its results"""
+    from game_enhanced import GameState
+
+    launch = time.perf_counter()
+    game = create_benchmark_game(seed=seed, playback=scenario.playback, background_cache_bytes=background_cache_bytes)
+    scenario.setup(game)
+    first_frame_ms = None
+
+    steps_per_frame = max(1, round(FRAME_TIME / game.sim_step))
+    profiler = FrameProfiler(window=scenario.frames)
+    frame_ms = []
+    transitions = 0
+    sector = game.sector
+    start = None
+
+    for frame in range(scenario.warmup + scenario.frames):
+        if frame == scenario.warmup:
+            # Measure from here on, with a clean profiler
+            game.profiler = profiler
+            start = time.perf_counter()
+        measuring = start is not None
+
+        frame_start = time.perf_counter()
+        game.profiler.begin_frame()
+        pygame.event.pump()
+        scenario.before_frame(game, frame)
+        with game.profiler.section("update"):
+            for _ in range(steps_per_frame):
+                keys = game.poll_input()
+                if game.state == GameState.PLAYING:
+                    game.update_playing(game.sim_step, keys)
+        game.render_alpha = 0.0
+        game.draw()
+        game.profiler.end_frame()
+        if first_frame_ms is None:
+            # Game construction through the first presented frame
+            first_frame_ms = (time.perf_counter() - launch) * 1000
+
+        if measuring:
+            frame_ms.append((time.perf_counter() - frame_start) * 1000)
+            if game.sector != sector:
+                transitions += 1
+        sector = game.sector
+
+        if game.playback and (game.state == GameState.GAME_OVER or game.playback.finished(game.sim_tick)):
+            break
+        # Scenarios measure load, not survival: keep the player in the game
+        if scenario.keep_alive and (game.state != GameState.PLAYING or game.player.mental_health < 50):
+            game.player.mental_health = 100
+            game.state = GameState.PLAYING
+
+    wall_time = time.perf_counter() - start
+    phases = {name: dict(zip(("p50", "p95", "p99"), (round(v, 3) for v in profiler.percentiles(name))))
+              for name in sorted(profiler.samples) if name != "frame"}
+    result = {
+        "description": scenario.description,
+        "seed": game.seed,
+        "time_to_first_frame_ms": round(first_frame_ms, 3),
+        "frames": len(frame_ms),
+        "sim_steps": len(frame_ms) * steps_per_frame,
+        "wall_time": round(wall_time, 4),
+        "fps": round(len(frame_ms) / wall_time, 1) if wall_time else 0.0,
+        "frame_ms": summarize(frame_ms),
+        "phases": phases,
+        "obstacles": len(game.obstacles),
+        "particles": len(game.particle_system),
+        "particle_budget": game.particle_system.stats(),
+        "sector_transitions": transitions,
+        "pools": game.pools.stats(),
+        "projectiles": game.projectiles.stats(),
+        "render_queue": game.render_queue.get_stats(),
+        "background_cache": game.background.cache.stats(),
+    }
+    if game.playback:
+        result["replay_matched"] = game.finish_replay() == game.playback.result
+    pygame.display.quit()
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """List regressions where p95 frame time grew by more than `tolerance`"""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if not old:
+            continue
+        before = old["frame_ms"]["p95"]
+        after = result["frame_ms"]["p95"]
+        if before > 0 and (after - before) / before > tolerance:
+            regressions.append(f"{name}: p95 {before:.2f} ms -> {after:.2f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Job Rush macro-benchmarks")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed for every scenario")
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS],
+                        help="run only this scenario (repeatable)")
+    parser.add_argument("--frames", type=int, default=None, help="override measured frames per scenario")
+    parser.add_argument("--replay", action="append", default=[],
+                        help="run a recorded input log as a scenario (repeatable); "
+                             "only replays run unless --scenario is also given")
+    parser.add_argument("--output", default=None, help="write JSON results to this file")
+    parser.add_argument("--baseline", default=None, help="compare against a previous results file")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed p95 frame-time growth vs baseline before failing (fraction)")
+    parser.add_argument("--background-cache-mb", type=float, default=SECTOR_CACHE_BYTES / (1024 * 1024),
+                        help="memory kept for built sector backgrounds (~32 MB per sector)")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(str(v) for v in pygame.get_sdl_version()),
+            "platform": platform.platform(),
+            "frame_time": FRAME_TIME,
+            "seed": args.seed,
+            "background_cache_mb": args.background_cache_mb,
+        },
+        "scenarios": {},
+    }
+
+    scenarios = [s for s in SCENARIOS if (args.scenario and s.name in args.scenario)
+                 or (not args.scenario and not args.replay)]
+    for scenario in scenarios:
+        if args.frames:
+            scenario.frames = args.frames
+    for path in args.replay:
+        scenarios.append(Replay(path))
+
+    for scenario in scenarios:
+        result = run_scenario(scenario, args.seed, int(args.background_cache_mb * 1024 * 1024))
+        results["scenarios"][scenario.name] = result
+        frame = result["frame_ms"]
+        print(f"{scenario.name:20} {result['fps']:8.1f} fps  "
+              f"p50 {frame['p50']:6.2f}  p95 {frame['p95']:6.2f}  p99 {frame['p99']:6.2f} ms  "
+              f"background evictions {result['background_cache']['evictions']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+        print(f"Results written to {args.output}")
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        status = 1 if regressions else 0
+
+    pygame.quit()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
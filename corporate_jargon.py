@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 import json
-import random
+from rng import stream
 import os
 
 class CorporateJargonGenerator:
     def __init__(self):
+        self.random = stream("jargon")
         self.buzzwords = {
             "nouns": [
                 "synergy", "paradigm", "leverage", "bandwidth", "deliverable",
@@ -118,26 +119,26 @@ class CorporateJargonGenerator:
             "{phrase} so we can {verb} our {adjective} {noun}."
         ]
         
-        template = random.choice(templates)
+        template = self.random.choice(templates)
         
         # Replace placeholders with random words
         while "{noun}" in template:
-            template = template.replace("{noun}", random.choice(self.buzzwords["nouns"]), 1)
+            template = template.replace("{noun}", self.random.choice(self.buzzwords["nouns"]), 1)
             
         while "{verb}" in template:
-            template = template.replace("{verb}", random.choice(self.buzzwords["verbs"]), 1)
+            template = template.replace("{verb}", self.random.choice(self.buzzwords["verbs"]), 1)
             
         while "{adjective}" in template:
-            template = template.replace("{adjective}", random.choice(self.buzzwords["adjectives"]), 1)
+            template = template.replace("{adjective}", self.random.choice(self.buzzwords["adjectives"]), 1)
             
         while "{phrase}" in template:
-            template = template.replace("{phrase}", random.choice(self.buzzwords["phrases"]), 1)
+            template = template.replace("{phrase}", self.random.choice(self.buzzwords["phrases"]), 1)
             
         return template
         
     def generate_job_posting(self):
         """Generate a satirical job posting"""
-        title = random.choice(self.job_titles)
+        title = self.random.choice(self.job_titles)
         
         # Generate description
         description_templates = [
@@ -147,20 +148,20 @@ class CorporateJargonGenerator:
             "We're disrupting the {noun} space and need a {adjective} rockstar!"
         ]
         
-        description = random.choice(description_templates)
+        description = self.random.choice(description_templates)
         
         # Replace placeholders
         while "{noun}" in description:
-            description = description.replace("{noun}", random.choice(self.buzzwords["nouns"]), 1)
+            description = description.replace("{noun}", self.random.choice(self.buzzwords["nouns"]), 1)
             
         while "{verb}" in description:
-            description = description.replace("{verb}", random.choice(self.buzzwords["verbs"]), 1)
+            description = description.replace("{verb}", self.random.choice(self.buzzwords["verbs"]), 1)
             
         while "{adjective}" in description:
-            description = description.replace("{adjective}", random.choice(self.buzzwords["adjectives"]), 1)
+            description = description.replace("{adjective}", self.random.choice(self.buzzwords["adjectives"]), 1)
             
         # Select 2-3 random requirements
-        requirements = random.sample(self.job_requirements, random.randint(2, 3))
+        requirements = self.random.sample(self.job_requirements, self.random.randint(2, 3))
         
         return {
             "title": title,
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+import pygame
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite that goes back to its pool when killed; subclasses (re)initialize in reset()"""
+    pool = None
+    pooled = False  # True while handed out by a pool
+
+    def reset(self, *args):
+        pass
+
+    def kill(self):
+        super().kill()
+        if self.pool:
+            self.pool.release(self)
+
+class EntityPool:
+    def __init__(self, kind, cls):
+        """Free list of reusable entities of one kind, with usage stats"""
+        self.kind = kind
+        self.cls = cls
+        self.free = []
+        self.in_use = 0
+        self.high_water = 0  # Most entities of this kind alive at once
+        self.acquired = 0
+        self.misses = 0  # Acquires that found the free list empty and built a new entity
+
+    def acquire(self, *args):
+        """A ready-to-use entity: a released one reset with `args`, or a new cls(*args)"""
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args)
+        else:
+            self.misses += 1
+            entity = self.cls(*args)  # __init__ calls reset itself
+            entity.pool = self
+        entity.pooled = True
+        self.acquired += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return entity
+
+    def release(self, entity):
+        if not entity.pooled:
+            return  # Already back (killed twice)
+        entity.pooled = False
+        self.in_use -= 1
+        self.free.append(entity)
+
+    def stats(self):
+        return {
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "acquired": self.acquired,
+            "misses": self.misses,
+        }
+
+class EntityPools:
+    def __init__(self):
+        """One EntityPool per entity kind (each obstacle and power-up type)"""
+        self.pools = {}
+
+    def acquire(self, kind, cls, *args):
+        pool = self.pools.get(kind)
+        if pool is None:
+            pool = self.pools[kind] = EntityPool(kind, cls)
+        return pool.acquire(*args)
+
+    def stats(self):
+        return {kind: pool.stats() for kind, pool in sorted(self.pools.items())}
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+import json
+import os
+import pygame
+
+# Kept apart from obstacle_patterns.json, which ObstacleGenerator rewrites on every run
+ENTITY_TYPES_PATH = os.path.join(os.path.dirname(__file__), "data", "entity_types.json")
+
+def key_code(name):
+    """pygame key constant for a key name like "e" (no pygame.init needed)"""
+    return getattr(pygame, f"K_{name}")
+
+class ObstacleType:
+    def __init__(self, name, data):
+        """Everything that differs between obstacle types, resolved once at load time"""
+        self.name = name
+        self.sprite = data.get("sprite", name)
+        self.sound = data.get("sound", name)
+        self.damage = data["damage"]
+        self.spawn_weight = data.get("spawn_weight", 0)
+        # "contact" hurts on touch; "qte", "pattern" and "clicks" are cleared by the player
+        self.interaction = data.get("interaction", "contact")
+        self.contact_damage = self.interaction == "contact"
+
+        qte = data.get("qte", {})
+        self.qte_key = key_code(qte["key"]) if qte else None
+        self.qte_count = qte.get("count", 0)
+
+        pattern = data.get("pattern", {})
+        self.pattern_keys = pattern.get("keys", [])
+        self.pattern_length = pattern.get("length", 0)
+        self.pattern_codes = {key: key_code(key) for key in self.pattern_keys}
+
+        self.required_clicks = data.get("clicks", 0)
+
+        shoots = data.get("shoots")
+        self.shoots = shoots is not None
+        if shoots:
+            self.shoot_interval = shoots["interval"]  # Seconds between shots
+            self.projectile_sprite = shoots["sprite"]
+            self.projectile_speed_scale = shoots["speed_scale"]
+            self.projectile_damage = shoots["damage"]
+
+class PowerUpType:
+    def __init__(self, name, data):
+        """Sprite, effect and sound of one power-up type"""
+        self.name = name
+        self.sprite = data.get("sprite", name)
+        self.sound = data.get("sound", name)
+        self.flag = data["flag"]  # Player attribute set while the power-up lasts
+        self.duration = data["duration"]
+        particles = data.get("particles")
+        self.particle_effect = f"add_{particles['effect']}_particles" if particles else None
+        self.particle_count = particles["count"] if particles else 0
+
+class EntityTypes:
+    def __init__(self, path=ENTITY_TYPES_PATH):
+        """Registry of obstacle and power-up descriptors, loaded once from data"""
+        with open(path) as f:
+            data = json.load(f)
+        self.obstacles = {name: ObstacleType(name, entry) for name, entry in data["obstacles"].items()}
+        self.power_ups = {name: PowerUpType(name, entry) for name, entry in data["power_ups"].items()}
+
+        # Spawn tables, in file order so seeded runs pick the same types
+        self.obstacle_names = list(self.obstacles)
+        self.obstacle_weights = [kind.spawn_weight for kind in self.obstacles.values()]
+        self.power_up_names = list(self.power_ups)
+
+# Shared registry
+entity_types = EntityTypes()
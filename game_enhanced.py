@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import pygame
 import sys
-import random
 import time
 from enum import Enum
 import textwrap
@@ -9,19 +8,30 @@ import textwrap
 # Import our components
 from player_enhanced import Player
 from obstacles_enhanced import Obstacle, PowerUp
-from visual_elements import ParallaxBackground, ParticleSystem, SpriteManager
+from visual_elements import NEXT_SECTOR, ParallaxBackground, ParticleSystem, SpriteManager
 from popup_system import PopupSystem
-from game_over import GameOverScreen
-from intro_sequence import IntroSequence
 from corporate_jargon import CorporateJargonGenerator
 from sound_system import SoundSystem
+from render_system import DirtyRectRenderer, RenderQueue, overlay_cache, get_overlay
+from text_cache import render_text
+from hud import HUD
+from profiler import FrameProfiler
+from asset_loader import AssetLoader
+from entity_pool import EntityPools
+from entity_types import entity_types
+from lane_index import LaneGroup
+from projectile_system import ProjectileSystem
+from sector_cache import SECTOR_CACHE_BYTES, SectorCache
+from rng import rng, stream
+from input_log import InputRecorder
+from scenes import (GameState, SceneStack, IntroScene, MenuScene, PlayingScene, PauseScene,
+                    GameOverScene, OutroScene)
 
-class GameState(Enum):
-    INTRO = 0
-    MENU = 1
-    PLAYING = 2
-    GAME_OVER = 3
-    PAUSED = 4
+# Fixed simulation rate; rendering runs independently and interpolates
+SIM_HZ = 120
+MAX_FRAME_TIME = 0.25  # Seconds of lag the simulation will try to catch up on
+BACKGROUND_BUILD_MS = 2.0  # Per-frame time spent building the next sector's background ahead
+LOADING_BUILD_MS = 4.0  # Per-frame main-thread time for finishing loaded assets during the intro
 
 class Sector(Enum):
     TECH = 4
@@ -31,14 +41,28 @@ class Sector(Enum):
     SILICON_VALLEY = 0
 
 class Game:
-    def __init__(self, screen, clock, audio_available=True):
+    def __init__(self, screen, clock, audio_available=True, headless=False, dirty_rects=False, profile_report_path=None,
+                 seed=None, record_path=None, playback=None, launch_time=None,
+                 background_cache_bytes=SECTOR_CACHE_BYTES):
         self.screen = screen
         self.clock = clock
         self.width = screen.get_width()
         self.height = screen.get_height()
+        self.headless = headless  # Simulation only: no intro, drawing or audio
         
-        # Initialize sound system FIRST
-        self.sound_system = SoundSystem(audio_available)
+        # Input replay: a playback run uses the recording's seed and skips the intro
+        self.playback = playback
+        if playback:
+            seed = playback.seed
+        
+        # Seed every subsystem's random stream before anything draws from them
+        self.seed = rng.reseed(seed)
+        self.spawn_random = stream("obstacles")
+        self.power_up_random = stream("power_ups")
+        self.effects_random = stream("effects")
+        
+        # Initialize sound system FIRST; its sounds are decoded by the asset loader
+        self.sound_system = SoundSystem(audio_available, load_sounds=False)
         
         # Calculate lane positions BEFORE reset_game
         self.lane_height = self.height // 3
@@ -51,25 +75,40 @@ class Game:
         # Initialize sector and transition score BEFORE creating background
         self.sector = "SILICON_VALLEY"
         self.sector_transition_score = 500
-        
-        # Initialize components
-        self.sprite_manager = SpriteManager()
-        self.particle_system = ParticleSystem()
-        self.background = ParallaxBackground(self.width, self.height, self.sector)
-        self.popup_system = PopupSystem(self.width, self.height)
-        self.popup_system.set_sound_system(self.sound_system)
-        self.jargon_generator = CorporateJargonGenerator()
-        
-        # Game state
-        self.state = GameState.INTRO
-        self.player_name = ""
-        
-        # Initialize game objects
-        self.reset_game()
+        self.background_cache_bytes = background_cache_bytes  # Memory for built sector backgrounds
+        
+        # Initialize components; asset-backed ones arrive from loader threads (see queue_assets)
+        self.particle_system = ParticleSystem(screen_size=(self.width, self.height))
+        self.pools = EntityPools()  # Obstacles and power-ups are reused, not rebuilt
+        self.projectiles = ProjectileSystem()  # Every recruiter bot's shots, batched
+        self.sprite_manager = None
+        self.background = None
+        self.popup_system = None
+        self.jargon_generator = None
+        self.assets_ready = False
+        self.loader = AssetLoader()
+        self.queue_assets()
+        
+        # Scenes share one loop; each is built the first time it is shown and then reused
+        self.scene_types = {
+            GameState.INTRO: IntroScene,
+            GameState.MENU: MenuScene,
+            GameState.PLAYING: PlayingScene,
+            GameState.PAUSED: PauseScene,
+            GameState.GAME_OVER: GameOverScene,
+            GameState.OUTRO: OutroScene,
+        }
+        self.scene_cache = {}
+        self.scenes = SceneStack()
+        self.running = True
         
         # Timing
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()
         self.delta_time = 0
+        self.sim_step = 1.0 / SIM_HZ
+        self.accumulator = 0.0
+        self.render_alpha = 1.0  # Fraction of a sim step to interpolate at draw time
+        self.max_fps = 60  # Render frame cap; 0 for uncapped
         
         # Sector descriptions
         self.sector_descriptions = {
@@ -81,11 +120,6 @@ class Game:
             # If you use enums, add: Sector.TECH: "...", etc.
         }
         
-        # Initialize layer offsets for background
-        self.background.create_placeholder_layers(self.sector)
-        for layer in self.background.layers:
-            layer["offset"] = 0
-            
         # UI elements
         self.buzzword_rotation = ["Leverage", "Disrupt", "Paradigm Shift", "Synergy", "Agile"]
         self.current_buzzword = 0
@@ -99,12 +133,102 @@ class Game:
         self.font_small = pygame.font.Font(None, 24)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_large = pygame.font.Font(None, 48)
+        self.font_desc = pygame.font.Font(None, 20)  # Sector banner description
         
         # New attributes
         self.flash_timer = 0
         self.shake_timer = 0
         self.shake_offset = (0, 0)
         
+        # Retained-mode HUD
+        self.hud = HUD(self)
+        
+        # Optional dirty-rectangle display updates instead of a full flip every frame
+        self.renderer = DirtyRectRenderer(screen) if dirty_rects and not headless else None
+        self.hud_rect = pygame.Rect(0, 0, self.width, self.hud.height)  # Area covered by draw_ui
+        
+        # Gameplay draws are queued per layer and submitted in batches (see draw_playing). Only
+        # projectiles are grouped by image: obstacles and particles overlap, so they keep draw order.
+        self.render_queue = RenderQueue(
+            ("background", "obstacles", "projectiles", "power_ups", "player", "particles", "hud"),
+            grouped=("projectiles",),
+            sections={"background": "background_draw", "obstacles": "sprites_draw", "projectiles": "sprites_draw",
+                      "power_ups": "sprites_draw", "player": "sprites_draw", "particles": "particles_draw",
+                      "hud": "draw_ui"})
+        self.lane_divider = pygame.Surface((self.width, 2))  # Same pixels as a 2px draw.line
+        self.lane_divider.fill((255, 255, 255))
+        
+        # Per-phase frame timings (F3 toggles the overlay)
+        self.profiler = FrameProfiler()
+        self.profile_report_path = profile_report_path  # Written when the loop exits
+        self.profiler.launch_time = launch_time  # perf_counter() at process start, for time-to-first-frame
+        self._drawn_state = None
+        self._drawn_offsets = None
+        
+        # Input recording, saved when the run ends
+        self.record_path = record_path
+        self.recorder = InputRecorder(self.seed, SIM_HZ) if record_path else None
+        
+        # Game state; only the intro runs before the assets are in, anything else waits for them
+        self.player_name = ""
+        self.state = GameState.PLAYING if headless or playback else GameState.INTRO
+        self.profiler.startup_mark("game_init")
+        
+    def queue_assets(self):
+        """Decode images and sounds on loader threads; the backdrop is then built a few steps per frame"""
+        # Weights roughly follow each job's share of the load time
+        self.loader.add("sprites", SpriteManager.read_animations, finish=SpriteManager, weight=1)
+        if not self.headless:  # Nothing is drawn when headless, so there is no backdrop to build
+            self.loader.add("background", ParallaxBackground.read_assets, self.width, self.height,
+                            finish=self.background_steps, weight=4, steps=True)
+        self.loader.add("jargon", CorporateJargonGenerator, weight=1)
+        self.loader.add("sounds", self.sound_system.read_sounds, finish=self.sounds_loaded, weight=3)
+        
+    def background_steps(self, assets):
+        """Generator: set up the backdrop on the main thread (fonts and pixel-format conversion need
+        it), then build the first sector a step at a time so the intro keeps running"""
+        logo_images, surfaces = assets
+        background = ParallaxBackground(self.width, self.height, self.sector, cache=SectorCache(self.background_cache_bytes),
+                                        logo_images=logo_images, spare_surfaces=surfaces, build=False)
+        yield
+        return (yield from background.load_steps(self.sector))
+        
+    def sounds_loaded(self, sfx):
+        self.sound_system.load_sounds(sfx)
+        self.sound_system.play_background_music()
+        
+    def update_loading(self):
+        """Take over finished assets; returns True once the game can start"""
+        if not self.assets_ready and self.loader.poll(LOADING_BUILD_MS):
+            self.assets_loaded()
+        return self.assets_ready
+        
+    def finish_loading(self):
+        """Wait for the loader threads (when something needs the assets right away)"""
+        if not self.assets_ready:
+            self.loader.wait()
+            self.update_loading()
+        
+    def assets_loaded(self):
+        """Wire up the components built from loaded assets and create the game objects"""
+        self.sprite_manager = self.loader.get("sprites")
+        if not self.headless:
+            self.background = self.loader.get("background")
+        self.jargon_generator = self.loader.get("jargon")
+        self.popup_system = PopupSystem(self.width, self.height, self.jargon_generator)
+        self.popup_system.set_sound_system(self.sound_system)
+        
+        # Initialize layer offsets for background
+        if self.background:
+            for layer in self.background.layers:
+                layer["offset"] = 0
+            
+        self.assets_ready = True
+        self.profiler.startup_mark("assets_ready")
+        
+        # Initialize game objects
+        self.reset_game()
+        
     def reset_game(self):
         """Reset the game to initial state"""
         # Create player
@@ -112,9 +236,16 @@ class Game:
         self.player.set_sound_system(self.sound_system)
         self.player.game_ref = self  # Add this line
         
-        # Create sprite groups
-        self.obstacles = pygame.sprite.Group()
-        self.power_ups = pygame.sprite.Group()
+        # Create sprite groups; a restart hands the old run's entities back to their pools
+        if hasattr(self, "obstacles"):
+            for sprite in self.obstacles.sprites() + self.power_ups.sprites():
+                sprite.kill()
+        else:
+            # Indexed by lane and x so collision checks only look near the player
+            self.obstacles = LaneGroup(len(self.lane_positions))
+            self.power_ups = LaneGroup(len(self.lane_positions))
+        self.active_obstacles = []  # Obstacles touching the player as of the last collision check
+        self.projectiles.clear()
         
         # Game variables
         self.speed = 200  # Initial speed
@@ -127,319 +258,483 @@ class Game:
         self.job_popup_timer = 0
         self.job_popup_interval = 15.0  # seconds
         
+        # Sim steps taken this run; input logs are stamped with it
+        self.sim_tick = 0
+        
+    @property
+    def state(self):
+        """The GameState of the scene on top of the stack"""
+        top = self.scenes.top
+        return top.state if top else None
+        
+    @state.setter
+    def state(self, state):
+        self.change_state(state)
+        
+    def get_scene(self, state):
+        scene = self.scene_cache.get(state)
+        if scene is None:
+            scene = self.scene_cache[state] = self.scene_types[state](self)
+        return scene
+        
+    def change_state(self, state):
+        """Switch scenes: pausing pushes over gameplay, resuming pops, anything else replaces the stack"""
+        current = self.state
+        if state == current:
+            return
+        if state not in (GameState.INTRO, GameState.OUTRO):
+            self.finish_loading()
+        if state == GameState.PAUSED and current == GameState.PLAYING:
+            self.scenes.push(self.get_scene(state))
+        elif current == GameState.PAUSED and state == GameState.PLAYING:
+            self.scenes.pop()
+        else:
+            self.scenes.replace(self.get_scene(state))
+            
+    def quit(self):
+        """Leave through the outro; replays and a second quit exit straight away"""
+        if self.playback or self.headless or self.state == GameState.OUTRO:
+            self.running = False
+        else:
+            self.state = GameState.OUTRO
+            
     def run(self):
         """Main game loop"""
-        running = True
+        self.running = True
         
-        while running:
-            # Calculate delta time
-            current_time = time.time()
-            self.delta_time = min(0.1, current_time - self.last_time)  # Cap delta time to prevent large jumps
+        while self.running:
+            # Measure real frame time
+            current_time = time.perf_counter()
+            frame_time = min(MAX_FRAME_TIME, current_time - self.last_time)  # Avoid a spiral of death after stalls
             self.last_time = current_time
+            self.profiler.begin_frame()
+            self.profiler.update_overlay(frame_time)
             
             # Handle events
-            running = self.handle_events()
+            with self.profiler.section("events"):
+                self.handle_events()
+            
+            # Update the active scene
+            self.sound_system.update()
+            self.scenes.top.update(frame_time)
             
-            # Update game state
-            self.update()
+            # A replay stops where its recording did
+            if self.playback and (self.state == GameState.GAME_OVER or self.playback.finished(self.sim_tick)):
+                self.finish_replay()
+                self.running = False
             
             # Draw everything
             self.draw()
+            self.profiler.end_frame()
             
             # Cap the frame rate
-            self.clock.tick(60)
+            self.clock.tick(self.max_fps)
+            
+        # Don't leave loader threads drawing after pygame shuts down
+        self.loader.close()
+        if self.profile_report_path:
+            self.profiler.write_report(self.profile_report_path)
+        if self.recorder and self.assets_ready:
+            self.stop_recording()
             
-        # Instead of quitting here, return a result
         return "quit"
         
     def handle_events(self):
         """Handle user input events"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                return False
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.state == GameState.PLAYING:
-                        self.state = GameState.PAUSED
-                    elif self.state == GameState.PAUSED:
-                        self.state = GameState.PLAYING
-                    elif self.state == GameState.GAME_OVER:
-                        return False
-                    
-                if self.state == GameState.INTRO:
-                    # Intro sequence handles its own events
-                    pass
-                elif self.state == GameState.MENU:
-                    if event.key == pygame.K_SPACE:
-                        self.state = GameState.PLAYING
-                        self.sound_system.play_sound("button_click")
-                        
-                elif self.state == GameState.GAME_OVER:
-                    if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-                        self.reset_game()
-                        self.state = GameState.PLAYING
-                        
-                elif self.state == GameState.PAUSED:
-                    if event.key == pygame.K_p:
-                        self.state = GameState.PLAYING
-                        
-                elif self.state == GameState.PLAYING:
-                    if event.key == pygame.K_p:
-                        self.state = GameState.PAUSED
-                    elif event.key == pygame.K_UP:
-                        self.player.change_lane("up")
-                    elif event.key == pygame.K_DOWN:
-                        self.player.change_lane("down")
-                    elif event.key == pygame.K_SPACE:
-                        self.player.jump()
-                    elif event.key == pygame.K_LCTRL or event.key == pygame.K_RCTRL:
-                        self.player.slide()
-                    elif event.key == pygame.K_e:
-                        # Handle skill gap obstacle interaction
-                        for obstacle in self.obstacles:
-                            if obstacle.obstacle_type == "skill_gap" and obstacle.active:
-                                if obstacle.handle_interaction(event.key):
-                                    break
-        return True
-        
-    def update(self):
-        """Update game state"""
-        # Update sound system
-        self.sound_system.update()
-        
-        if self.state == GameState.INTRO:
-            # Run intro sequence
-            intro = IntroSequence(self.screen, self.clock, self.sound_system)
-            self.player_name = intro.run()
-            if self.player_name:  # Only proceed if we got a name
-                self.state = GameState.MENU
+                self.quit()
+                continue
+            
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) and self.renderer:
+                # Window contents were lost; repaint everything
+                self.renderer.invalidate()
+                
+            if event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED, pygame.WINDOWDISPLAYCHANGED):
+                # Display mode changed; rebuild overlays in the new format
+                overlay_cache.clear()
+            
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+                continue
+                
+            # Everything else belongs to the active scene
+            self.scenes.top.handle_event(event)
+            
+        if self.playback:
+            # Presses logged while paused share a tick, so unpausing happens here
+            self.replay_keys()
             
-        elif self.state == GameState.MENU:
-            # Menu state - background music should be playing
-            pass
+    def on_key_press(self, key):
+        """Key press from the keyboard in the menu, gameplay or pause scenes"""
+        if self.playback:
+            # Gameplay input comes from the log; ESC ends the replay
+            if key == pygame.K_ESCAPE:
+                self.running = False
+            return
+        if self.recorder and self.state in (GameState.PLAYING, GameState.PAUSED):
+            self.recorder.record_key(self.sim_tick, key)
+        self.handle_key(key)
+        
+    def handle_key(self, key):
+        """Apply one key press (live or replayed)"""
+        if key == pygame.K_ESCAPE:
+            if self.state == GameState.PLAYING:
+                self.state = GameState.PAUSED
+            elif self.state == GameState.PAUSED:
+                self.state = GameState.PLAYING
             
+        if self.state == GameState.MENU:
+            if key == pygame.K_SPACE:
+                self.state = GameState.PLAYING
+                self.sound_system.play_sound("button_click")
+                
+        elif self.state == GameState.PAUSED:
+            if key == pygame.K_p:
+                self.state = GameState.PLAYING
+                
         elif self.state == GameState.PLAYING:
-            # When entering playing state, switch to Silicon Valley music
-            if not hasattr(self, '_music_initialized'):
-                self.sound_system.play_silicon_valley_music()
-                self._music_initialized = True
+            if key == pygame.K_p:
+                self.state = GameState.PAUSED
+            elif key == pygame.K_UP:
+                self.player.change_lane("up")
+            elif key == pygame.K_DOWN:
+                self.player.change_lane("down")
+            elif key == pygame.K_SPACE:
+                self.player.jump()
+            elif key == pygame.K_LCTRL or key == pygame.K_RCTRL:
+                self.player.slide()
+            elif key == pygame.K_e:
+                # Handle skill gap obstacle interaction
+                for obstacle in self.active_obstacles:
+                    if obstacle.kind.qte_key == key and obstacle.active and obstacle.alive():
+                        if obstacle.handle_interaction(key):
+                            break
+        
+    def replay_keys(self):
+        """Apply logged key presses that are due before the next sim step"""
+        for key in self.playback.pop_keys(self.sim_tick):
+            self.handle_key(key)
             
-            # Update player
-            keys = pygame.key.get_pressed()
-            self.player.update(self.delta_time, keys)
+    def poll_input(self):
+        """Held keys for the next sim step: live (and recorded) or from the replay log"""
+        if self.playback:
+            self.replay_keys()
+            return self.playback.keys_at(self.sim_tick)
+        keys = pygame.key.get_pressed()
+        if self.recorder:
+            self.recorder.record_keys(self.sim_tick, keys)
+        return keys
+        
+    def run_result(self):
+        """End state of the run, stored with a recording and checked by its replay"""
+        return {
+            "tick": self.sim_tick,
+            "score": self.player.score,
+            "mental_health": self.player.mental_health,
+            "sector": self.sector_to_str(self.sector),
+            "state": self.state.name,
+        }
+        
+    def stop_recording(self):
+        self.recorder.save(self.record_path, self.sim_tick, self.run_result())
+        self.recorder = None
+        
+    def finish_replay(self):
+        """Report whether the replay reproduced the recorded run"""
+        result = self.run_result()
+        expected = self.playback.result
+        if expected and result != expected:
+            print(f"Replay diverged at tick {self.sim_tick}: expected {expected}, got {result}")
+        else:
+            print(f"Replay finished at tick {self.sim_tick} ({self.sim_tick / SIM_HZ:.2f}s): {result}")
+        return result
+        
+    def update(self):
+        """One fixed simulation step of the PLAYING scene"""
+        # When entering playing state, switch to Silicon Valley music
+        if not hasattr(self, '_music_initialized'):
+            self.sound_system.play_silicon_valley_music()
+            self._music_initialized = True
+        
+        keys = self.poll_input()
+        if self.state == GameState.PLAYING:  # A replayed key may have paused the game
+            self.update_playing(self.delta_time, keys)
             
-            # Update background
+    def update_playing(self, delta_time, keys):
+        """Advance the PLAYING simulation by delta_time seconds (no drawing)"""
+        self.delta_time = delta_time
+        
+        profiler = self.profiler
+        
+        # Update player
+        with profiler.section("player_update"):
+            self.player.update(self.delta_time, keys)
+        
+        # Update background
+        if self.background:
             for layer in self.background.layers:
+                layer["prev_offset"] = layer["offset"]
                 layer["offset"] = (layer["offset"] + self.speed * layer["speed"] * self.delta_time) % layer["surface"].get_width()
-            # self.background.update_animated_layers(self.delta_time)
-            
-            # Update obstacles and power-ups
+        # self.background.update_animated_layers(self.delta_time)
+        
+        # Update obstacles and power-ups
+        with profiler.section("obstacles_update"):
+            # Keep each lane's x order current for collision queries
             for obstacle in self.obstacles:
                 obstacle.update(self.delta_time, self.lane_positions)
+                self.obstacles.moved(obstacle)
                 
             for power_up in self.power_ups:
                 power_up.update(self.delta_time, self.lane_positions)
+                self.power_ups.moved(power_up)
                 
-            # Update particles
+            # After the obstacles, so shots fired this step move too
+            self.projectiles.update(self.delta_time)
+            
+        # Update particles
+        with profiler.section("particles_update"):
             self.particle_system.update(self.delta_time)
+        
+        # Update popups
+        self.popup_system.update(self.delta_time)
+        
+        # Spawn obstacles
+        self.obstacle_timer += self.delta_time
+        if self.obstacle_timer >= self.obstacle_interval:
+            self.spawn_obstacle()
+            self.obstacle_timer = 0
             
-            # Update popups
-            self.popup_system.update(self.delta_time)
+        # Spawn power-ups
+        self.power_up_timer += self.delta_time
+        if self.power_up_timer >= self.power_up_interval:
+            self.spawn_power_up()
+            self.power_up_timer = 0
             
-            # Spawn obstacles
-            self.obstacle_timer += self.delta_time
-            if self.obstacle_timer >= self.obstacle_interval:
-                self.spawn_obstacle()
-                self.obstacle_timer = 0
-                
-            # Spawn power-ups
-            self.power_up_timer += self.delta_time
-            if self.power_up_timer >= self.power_up_interval:
-                self.spawn_power_up()
-                self.power_up_timer = 0
-                
-            # Update job popup timer
-            self.job_popup_timer += self.delta_time
-            if self.job_popup_timer >= self.job_popup_interval:
-                self.job_popup_timer = 0
-                self.popup_system.show_job_posting()
-                
-            # Update buzzword rotation
-            self.buzzword_timer += self.delta_time
-            if self.buzzword_timer >= self.buzzword_interval:
-                self.buzzword_timer = 0
-                self.current_buzzword = (self.current_buzzword + 1) % len(self.buzzword_rotation)
-                
-            # Check collisions
+        # Update job popup timer
+        self.job_popup_timer += self.delta_time
+        if self.job_popup_timer >= self.job_popup_interval:
+            self.job_popup_timer = 0
+            self.popup_system.show_job_posting()
+            
+        # Update buzzword rotation
+        self.buzzword_timer += self.delta_time
+        if self.buzzword_timer >= self.buzzword_interval:
+            self.buzzword_timer = 0
+            self.current_buzzword = (self.current_buzzword + 1) % len(self.buzzword_rotation)
+            
+        # Check collisions
+        with profiler.section("collisions"):
             self.check_collisions()
+        
+        # Update score
+        self.player.score += self.speed * self.delta_time * 0.01
+        
+        # Update speed based on score
+        self.speed = 200 * (1 + (self.player.score // 100) * 0.05)
+        
+        # Check for sector transitions
+        if self.player.score > self.sector_transition_score:
+            old_sector = self.sector
             
-            # Update score
-            self.player.score += self.speed * self.delta_time * 0.01
+            # Determine the next sector
+            next_sector = NEXT_SECTOR.get(self.sector)
             
-            # Update speed based on score
-            self.speed = 200 * (1 + (self.player.score // 100) * 0.05)
+            # Only transition if the next sector is different
+            if next_sector and next_sector != self.sector:
+                self.sector = next_sector
+                profiler.mark("sector_transition")
+                self.popup_system.show_sector_transition(old_sector, self.sector)
+                if self.background:
+                    with profiler.section("background_build"):
+                        # Instant when cached or already built ahead
+                        self.background.set_sector(self.sector)
+                self.sector_transition_score += 500
+                self.sound_system.play_sound("sector_transition")
+                self.sound_system.play_bgm(self.sector)
             
-            # Check for sector transitions
-            if self.player.score > self.sector_transition_score:
-                old_sector = self.sector
-                
-                # Determine the next sector (example logic, adjust as needed)
-                next_sector = None
-                if self.sector == "SILICON_VALLEY":
-                    next_sector = "TECH"
-                elif self.sector == "TECH":
-                    next_sector = "ACADEMIA"
-                elif self.sector == "ACADEMIA":
-                    next_sector = "CREATIVE"
-                elif self.sector == "CREATIVE":
-                    next_sector = "RETAIL"
-                elif self.sector == "RETAIL":
-                    next_sector = "SILICON_VALLEY"
-                
-                # Only transition if the next sector is different
-                if next_sector and next_sector != self.sector:
-                    self.sector = next_sector
-                    self.popup_system.show_sector_transition(old_sector, self.sector)
-                    self.background.create_placeholder_layers(self.sector)
-                    for layer in self.background.layers:
-                        layer["offset"] = 0
-                    self.sector_transition_score += 500
-                    self.sound_system.play_sound("sector_transition")
-                    self.sound_system.play_bgm(self.sector)
-                
-            # Update coffee cups based on mental health
-            self.coffee_cups = max(0, min(5, int(self.player.mental_health / 20)))
+        # Update coffee cups based on mental health
+        self.coffee_cups = max(0, min(5, int(self.player.mental_health / 20)))
+        
+        # Count the step before a game over, whose scene saves the recording up to here
+        self.sim_tick += 1
+        
+        # Game over condition
+        if self.player.mental_health <= 0:
+            self.state = GameState.GAME_OVER
             
-            # Game over condition
-            if self.player.mental_health <= 0:
-                self.state = GameState.GAME_OVER
-                
-        elif self.state == GameState.GAME_OVER:
-            # Show game over screen
-            game_over = GameOverScreen(self.screen, self.clock, self.player.score, self.sector_to_str(self.sector), self.player_name)
-            result = game_over.run()
-            if result == "restart":
-                self.reset_game()
-                self.state = GameState.PLAYING
-            elif result == "quit":
-                # Set a flag to break the main loop
-                self._user_quit = True
-                
     def spawn_obstacle(self):
         """Spawn a random obstacle"""
-        obstacle_types = ["skill_gap", "ats_laser", "experience_wall", "burnout_cloud", "recruiter_bot"]
-        weights = [0.25, 0.25, 0.2, 0.15, 0.15]  # Probability weights
-        obstacle_type = random.choices(obstacle_types, weights=weights)[0]
-        lane = random.randint(0, 2)
+        obstacle_type = self.spawn_random.choices(entity_types.obstacle_names, weights=entity_types.obstacle_weights)[0]
+        lane = self.spawn_random.randint(0, 2)
         
-        new_obstacle = Obstacle(obstacle_type, lane, self.speed, self.sprite_manager, self.particle_system)
+        new_obstacle = self.pools.acquire(obstacle_type, Obstacle, obstacle_type, lane, self.speed,
+                                          self.sprite_manager, self.particle_system)
         new_obstacle.game_ref = self  # Add this line
         self.obstacles.add(new_obstacle)
         
     def spawn_power_up(self):
         """Spawn a random power-up"""
-        power_up_types = ["nepotism_pass", "linkedin_premium", "mentorship_shield", "bootcamp_speed"]
-        power_up_type = random.choice(power_up_types)
-        lane = random.randint(0, 2)
+        power_up_type = self.power_up_random.choice(entity_types.power_up_names)
+        lane = self.power_up_random.randint(0, 2)
         
-        new_power_up = PowerUp(power_up_type, lane, self.speed, self.sprite_manager)
+        new_power_up = self.pools.acquire(power_up_type, PowerUp, power_up_type, lane, self.speed, self.sprite_manager)
         self.power_ups.add(new_power_up)
         
     def check_collisions(self):
         """Check for collisions between player and game objects"""
-        # Check obstacle collisions
-        for obstacle in self.obstacles:
-            if obstacle.rect.colliderect(self.player.rect) and obstacle.lane == self.player.current_lane:
-                obstacle.active = True
-                
-                # If player has shield, destroy obstacle
-                if self.player.has_mentorship_shield:
-                    obstacle.kill()
-                    self.player.add_score(50)
-                    continue
-                    
-                # Handle burnout cloud and recruiter bot collisions immediately
-                if obstacle.obstacle_type in ["burnout_cloud", "recruiter_bot"] and not obstacle.hit:
-                    obstacle.hit = True
-                    self.player.take_damage(obstacle.damage)
-                    
-            else:
+        player_rect = self.player.rect
+        
+        # Only obstacles in the player's lane and near the player's x can touch them
+        touching = self.obstacles.colliding(player_rect, (self.player.current_lane,))
+        for obstacle in self.active_obstacles:
+            if obstacle not in touching:
                 obstacle.active = False
+        self.active_obstacles = []
+        for obstacle in touching:
+            obstacle.active = True
+            
+            # If player has shield, destroy obstacle
+            if self.player.has_mentorship_shield:
+                obstacle.kill()
+                self.player.add_score(50)
+                continue
+            self.active_obstacles.append(obstacle)
+                
+            # Handle burnout cloud and recruiter bot collisions immediately
+            if obstacle.kind.contact_damage and not obstacle.hit:
+                obstacle.hit = True
+                self.player.take_damage(obstacle.damage)
                 
-            # Check recruiter bot projectile collisions
-            if obstacle.obstacle_type == "recruiter_bot":
-                for projectile in obstacle.projectiles:
-                    if projectile.rect.colliderect(self.player.rect):
-                        projectile.kill()
-                        if not self.player.has_mentorship_shield:
-                            self.player.take_damage(projectile.damage)
+        # Check recruiter bot projectile collisions
+        for damage in self.projectiles.collide(player_rect):
+            if not self.player.has_mentorship_shield:
+                self.player.take_damage(damage)
                 
-        # Check power-up collisions
-        power_up_hits = pygame.sprite.spritecollide(self.player, self.power_ups, True)
+        # Check power-up collisions (any lane; a power-up that touches the player is used up)
+        power_up_hits = self.power_ups.colliding(player_rect)
         for power_up in power_up_hits:
+            power_up.kill()
             if power_up.lane == self.player.current_lane or self.player.has_nepotism_pass:
                 self.player.activate_power_up(power_up.power_up_type)
                 self.player.add_score(25)
                 
     def draw(self):
-        """Draw the game"""
+        """Draw the active scene(s), the profiler overlay, and present the frame"""
+        if self.renderer:
+            if self.state != self._drawn_state:
+                self.renderer.invalidate()
+                self._drawn_state = self.state
+            elif (self.state in (GameState.MENU, GameState.PAUSED) and not self.renderer.needs_redraw()
+                  and not self.profiler.show_overlay):
+                # Static screen and nothing changed: skip drawing entirely
+                self.renderer.present()
+                return
+            elif not self.scenes.top.dirty_rects:
+                # Scene doesn't report changed areas; push the whole frame
+                self.renderer.invalidate()
+            
         # Clear the screen
         self.screen.fill((0, 0, 0))
         
-        if self.state == GameState.INTRO:
-            # Intro sequence handles its own drawing
-            pass
+        self.scenes.draw(self.screen)
             
-        elif self.state == GameState.MENU:
-            self.draw_menu()
+        # Profiler overlay goes on top of everything
+        overlay_rect = self.profiler.draw_overlay(self.screen)
+        if self.renderer:
+            self.renderer.add(overlay_rect)
             
-        elif self.state == GameState.PLAYING or self.state == GameState.PAUSED:
-            # Draw background
+        # Update the display
+        with self.profiler.section("display_flip"):
+            if self.renderer:
+                self.renderer.present()
+            else:
+                pygame.display.flip()
+        
+    def draw_playing(self):
+        """Draw the game world, HUD and popups"""
+        alpha = self.render_alpha
+        queue = self.render_queue
+        
+        # Draw background
+        offsets = []
+        with self.profiler.section("background_draw"):
             for i, layer in enumerate(self.background.layers):
-                offset = int(layer["offset"])
-                self.screen.blit(layer["surface"], (-offset, 0))
-                self.screen.blit(layer["surface"], (layer["surface"].get_width() - offset, 0))
-            
-            # Draw lane dividers
-            for i in range(1, 3):
-                pygame.draw.line(self.screen, (255, 255, 255), 
-                                (0, i * self.lane_height), 
-                                (self.width, i * self.lane_height), 2)
-                
-            # Draw obstacles and power-ups
-            for obstacle in self.obstacles:
-                self.screen.blit(obstacle.image, obstacle.rect)
-                
-                # Draw recruiter bot projectiles
-                if obstacle.obstacle_type == "recruiter_bot":
-                    obstacle.draw_projectiles(self.screen)
-                
-            for power_up in self.power_ups:
-                self.screen.blit(power_up.image, power_up.rect)
-                
-            # Draw player
-            self.screen.blit(self.player.image, self.player.rect)
+                width = layer["surface"].get_width()
+                prev_offset = layer.get("prev_offset", layer["offset"])
+                # Interpolate forwards, allowing for the offset wrapping around
+                offset = int(prev_offset + ((layer["offset"] - prev_offset) % width) * alpha) % width
+                offsets.append(offset)
+                queue.add("background", layer["surface"], (-offset, 0))
+                queue.add("background", layer["surface"], (width - offset, 0))
             
-            # Draw particles
-            self.particle_system.draw(self.screen)
+        if self.renderer and offsets != self._drawn_offsets:
+            # A scrolled background changes every pixel, so flip the whole frame
+            self.renderer.invalidate()
+            self._drawn_offsets = offsets
+        # Changed areas only matter if the frame isn't going to be flipped whole
+        collect = self.renderer is not None and not self.renderer.full_redraw
+        
+        # Draw lane dividers
+        for i in range(1, 3):
+            queue.add("background", self.lane_divider, (0, i * self.lane_height))
             
-            # Draw UI
-            self.draw_ui()
+        # Draw obstacles and power-ups
+        for obstacle in self.obstacles:
+            pos = obstacle.get_render_pos(alpha)
+            queue.add("obstacles", obstacle.image, pos)
+            if collect:
+                self.mark_dirty(obstacle.image, pos)
             
-            # Draw popups
-            self.popup_system.draw(self.screen)
+        # Draw recruiter bot projectiles
+        commands = self.projectiles.commands(alpha)
+        queue.extend("projectiles", commands)
+        if collect:
+            for image, pos in commands:
+                self.mark_dirty(image, pos)
             
-            # Draw pause screen if paused
-            if self.state == GameState.PAUSED:
-                self.draw_pause_screen()
-                
-        elif self.state == GameState.GAME_OVER:
-            # Game over screen handles its own drawing
-            pass
+        for power_up in self.power_ups:
+            pos = power_up.get_render_pos(alpha)
+            queue.add("power_ups", power_up.image, pos)
+            if collect:
+                self.mark_dirty(power_up.image, pos)
             
-        # Update the display
-        pygame.display.flip()
+        # Draw player
+        pos = self.player.get_render_pos(alpha)
+        queue.add("player", self.player.image, pos)
+        if collect:
+            self.mark_dirty(self.player.image, pos)
+        
+        # Draw particles
+        with self.profiler.section("particles_draw"):
+            self.particle_system.shed_load(self.profiler.last_frame_ms)
+            queue.extend("particles", self.particle_system.commands())
+        if collect:
+            self.renderer.add(self.particle_system.get_bounds())
+        
+        # Draw UI
+        with self.profiler.section("draw_ui"):
+            self.draw_ui()
+        if collect:
+            self.renderer.add(self.hud_rect)
+            
+        # Build some of the next sector's background
+        with self.profiler.section("background_build_ahead"):
+            self.background.build_ahead(BACKGROUND_BUILD_MS)
+            
+        # Everything above goes to the screen in one batched call per layer, each timed under its draw section
+        queue.flush(self.screen, self.profiler)
+        
+        # Draw popups
+        with self.profiler.section("popups_draw"):
+            self.popup_system.draw(self.screen)
+        if collect and self.popup_system.active_popup:
+            self.renderer.add(self.screen.get_rect())  # Popups dim the whole screen
+        
+    def mark_dirty(self, image, pos):
+        """Record the screen area an image was blitted to (dirty-rect mode only)"""
+        if self.renderer:
+            self.renderer.add(image.get_rect(topleft=pos))
         
     def draw_menu(self):
         """Draw the main menu"""
@@ -450,33 +745,31 @@ class Game:
             self.screen.blit(layer["surface"], (layer["surface"].get_width() - offset, 0))
         
         # Stronger semi-transparent overlay for better contrast
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 210))  # Increased alpha for more darkness
+        overlay = get_overlay((self.width, self.height), (0, 0, 0, 210))  # Increased alpha for more darkness
         self.screen.blit(overlay, (0, 0))
         
         # Title
-        title_text = self.font_large.render("JOB RUSH 2025", True, (255, 255, 255))
+        title_text = render_text(self.font_large, "JOB RUSH 2025", True, (255, 255, 255))
         self.screen.blit(title_text, (self.width // 2 - title_text.get_width() // 2, self.height // 3 - 60))
         
         # Subtitle
-        subtitle_text = self.font_medium.render("THE JOB MARKET SIMULATOR NOBODY ASKED FOR", True, (255, 0, 0))
+        subtitle_text = render_text(self.font_medium, "THE JOB MARKET SIMULATOR NOBODY ASKED FOR", True, (255, 0, 0))
         self.screen.blit(subtitle_text, (self.width // 2 - subtitle_text.get_width() // 2, self.height // 3))
         
         # Player name with background box
         if self.player_name:
-            name_text = self.font_large.render(f"Player: {self.player_name}", True, (0, 0, 0))
+            name_text = render_text(self.font_large, f"Player: {self.player_name}", True, (0, 0, 0))
             name_bg_width = name_text.get_width() + 40
             name_bg_height = name_text.get_height() + 20
             name_bg_x = self.width // 2 - name_bg_width // 2
             name_bg_y = self.height // 3 + 70
 
             # Draw rounded rectangle background (or just a rect if you prefer)
-            name_bg = pygame.Surface((name_bg_width, name_bg_height), pygame.SRCALPHA)
-            name_bg.fill((255, 255, 255, 220))  # White with some transparency
+            name_bg = get_overlay((name_bg_width, name_bg_height), (255, 255, 255, 220))  # White with some transparency
             self.screen.blit(name_bg, (name_bg_x, name_bg_y))
 
             # Draw the player name in bold/dark text for contrast
-            name_text = self.font_large.render(f"Player: {self.player_name}", True, (30, 30, 30))
+            name_text = render_text(self.font_large, f"Player: {self.player_name}", True, (30, 30, 30))
             self.screen.blit(name_text, (self.width // 2 - name_text.get_width() // 2, name_bg_y + 10))
         
         # Instructions (with more spacing)
@@ -492,101 +785,32 @@ class Game:
         ]
         instruction_y = self.height // 2 + 60
         for instruction in instructions:
-            instruction_text = self.font_small.render(instruction, True, (255, 255, 255))
+            instruction_text = render_text(self.font_small, instruction, True, (255, 255, 255))
             self.screen.blit(instruction_text, (self.width // 2 - instruction_text.get_width() // 2, instruction_y))
             instruction_y += 36  # More vertical space
             
     def draw_ui(self):
-        """Draw the game UI"""
-        # Draw mental health as coffee cups
-        for i in range(5):
-            if i < self.coffee_cups:
-                cup_image = self.sprite_manager.get_sprite("coffee_cup")
-                self.sound_system.play_sound("coffee_cup")
-            else:
-                cup_image = self.sprite_manager.get_sprite("empty_cup")
-            self.screen.blit(cup_image, (20 + i * 25, 20))
-            
-        # Draw mental health text
-        health_text = self.font_small.render(f"Mental Health: {int(self.player.mental_health)}", True, (255, 255, 255))
-        self.screen.blit(health_text, (20, 50))
-        
-        # Draw score with rotating buzzword
-        score_text = self.font_medium.render(f"{self.buzzword_rotation[self.current_buzzword]} Points: {int(self.player.score)}", True, (255, 255, 255))
-        self.screen.blit(score_text, (self.width - score_text.get_width() - 20, 20))
-        
-        # Draw sector banner with auto-wrapping and dynamic height
-        banner_width = 400
-        desc = self.sector_descriptions.get(self.sector)
-        if desc is None and hasattr(self.sector, "name"):
-            desc = self.sector_descriptions.get(self.sector.name)
-        if desc is None:
-            desc = "Welcome to the job market!"
-
-        desc_font = pygame.font.Font(None, 20)
-        max_width = banner_width - 20
-        desc_lines = []
-        line = ""
-        for word in desc.split():
-            test_line = f"{line} {word}".strip()
-            if desc_font.size(test_line)[0] <= max_width:
-                line = test_line
-            else:
-                desc_lines.append(line)
-                line = word
-        if line:
-            desc_lines.append(line)
-
-        banner_height = 30 + 20 * len(desc_lines)
-        banner_x = self.width // 2 - banner_width // 2
-        banner_y = 10
-        banner_rect = pygame.Rect(banner_x, banner_y, banner_width, banner_height)
-        pygame.draw.rect(self.screen, (0, 0, 0, 180), banner_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (255, 255, 255), banner_rect, 2, border_radius=10)
-
-        sector_str = self.sector if isinstance(self.sector, str) else getattr(self.sector, "name", str(self.sector))
-        sector_text = self.font_medium.render(f"SECTOR: {sector_str}", True, (255, 255, 255))
-        self.screen.blit(sector_text, (banner_x + 10, banner_y + 5))
-
-        for i, line in enumerate(desc_lines):
-            desc_surface = desc_font.render(line, True, (255, 0, 0))
-            self.screen.blit(desc_surface, (banner_x + 10, banner_y + 30 + i * 20))
-
-        # Draw active power-ups
-        power_up_y = 80
-        if self.player.has_nepotism_pass:
-            power_up_text = self.font_small.render("Nepotism Pass Active!", True, (255, 215, 0))
-            self.screen.blit(power_up_text, (20, power_up_y))
-            power_up_y += 25
-        if self.player.has_linkedin_premium:
-            power_up_text = self.font_small.render("LinkedIn Premium Active!", True, (0, 119, 181))
-            self.screen.blit(power_up_text, (20, power_up_y))
-            power_up_y += 25
-        if self.player.has_mentorship_shield:
-            power_up_text = self.font_small.render("Mentorship Shield Active!", True, (0, 255, 0))
-            self.screen.blit(power_up_text, (20, power_up_y))
-            power_up_y += 25
-        if self.player.has_bootcamp_speed:
-            power_up_text = self.font_small.render("Bootcamp Speed Active!", True, (255, 255, 0))
-            self.screen.blit(power_up_text, (20, power_up_y))
+        """Queue the game UI"""
+        # The HUD only re-renders widgets whose values changed
+        self.hud.update()
+        self.render_queue.add("hud", self.hud.surface, (0, 0))
         
     def draw_pause_screen(self):
         """Draw the pause screen overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = get_overlay((self.width, self.height), (0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
         
         # Pause text
-        pause_text = self.font_large.render("PAUSED", True, (255, 255, 255))
+        pause_text = render_text(self.font_large, "PAUSED", True, (255, 255, 255))
         self.screen.blit(pause_text, (self.width // 2 - pause_text.get_width() // 2, self.height // 3))
         
         # Resume instructions
-        resume_text = self.font_medium.render("Press P to Resume", True, (255, 255, 255))
+        resume_text = render_text(self.font_medium, "Press P to Resume", True, (255, 255, 255))
         self.screen.blit(resume_text, (self.width // 2 - resume_text.get_width() // 2, self.height // 2))
         
         # Quit instructions
-        quit_text = self.font_small.render("Press ESC to Quit", True, (255, 255, 255))
+        quit_text = render_text(self.font_small, "Press ESC to Quit", True, (255, 255, 255))
         self.screen.blit(quit_text, (self.width // 2 - quit_text.get_width() // 2, self.height // 2 + 50))
 
     def sector_to_str(self, sector):
@@ -597,7 +821,7 @@ class Game:
             self.flash_timer -= self.delta_time
         if self.shake_timer > 0:
             self.shake_timer -= self.delta_time
-            self.shake_offset = (random.randint(-6, 6), random.randint(-6, 6))
+            self.shake_offset = (self.effects_random.randint(-6, 6), self.effects_random.randint(-6, 6))
         else:
             self.shake_offset = (0, 0)
 
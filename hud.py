@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+import pygame
+from text_cache import render_text
+
+class HUD:
+    def __init__(self, game, height=180):
+        """Retained-mode HUD: each widget re-renders only when its value changes"""
+        self.game = game
+        self.width = game.width
+        self.height = height
+        self.surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+
+        # Widget name -> (surface, position) and the value it was rendered from
+        self.widgets = {}
+        self.values = {}
+        self.needs_compose = True
+
+        # Stats
+        self.widget_renders = 0
+        self.composes = 0
+
+        self.power_up_labels = [
+            ("has_nepotism_pass", "Nepotism Pass Active!", (255, 215, 0)),
+            ("has_linkedin_premium", "LinkedIn Premium Active!", (0, 119, 181)),
+            ("has_mentorship_shield", "Mentorship Shield Active!", (0, 255, 0)),
+            ("has_bootcamp_speed", "Bootcamp Speed Active!", (255, 255, 0)),
+        ]
+
+    def update(self):
+        """Re-render any widget whose backing value changed, then recompose"""
+        game = self.game
+        player = game.player
+        self.refresh("coffee_cups", game.coffee_cups, self.render_coffee_cups)
+        self.refresh("health", int(player.mental_health), self.render_health)
+        self.refresh("score", (game.buzzword_rotation[game.current_buzzword], int(player.score)), self.render_score)
+        self.refresh("sector_banner", game.sector, self.render_sector_banner)
+        self.refresh("power_ups", tuple(getattr(player, flag) for flag, _, _ in self.power_up_labels), self.render_power_ups)
+
+        if self.needs_compose:
+            self.surface.fill((0, 0, 0, 0))
+            for widget_surface, pos in self.widgets.values():
+                if widget_surface is not None:
+                    self.surface.blit(widget_surface, pos)
+            self.needs_compose = False
+            self.composes += 1
+
+    def refresh(self, name, value, render):
+        if name in self.widgets and self.values[name] == value:
+            return
+        self.values[name] = value
+        self.widgets[name] = render(value)
+        self.needs_compose = True
+        self.widget_renders += 1
+
+    def render_coffee_cups(self, coffee_cups):
+        """Mental health as coffee cups"""
+        sprite_manager = self.game.sprite_manager
+        full_cup = sprite_manager.get_sprite("coffee_cup")
+        empty_cup = sprite_manager.get_sprite("empty_cup")
+        widget = pygame.Surface((4 * 25 + full_cup.get_width(), full_cup.get_height()), pygame.SRCALPHA)
+        for i in range(5):
+            widget.blit(full_cup if i < coffee_cups else empty_cup, (i * 25, 0))
+        if coffee_cups > 0:
+            self.game.sound_system.play_sound("coffee_cup")
+        return widget, (20, 20)
+
+    def render_health(self, mental_health):
+        text = render_text(self.game.font_small, f"Mental Health: {mental_health}", True, (255, 255, 255))
+        return text, (20, 50)
+
+    def render_score(self, value):
+        buzzword, score = value
+        text = render_text(self.game.font_medium, f"{buzzword} Points: {score}", True, (255, 255, 255))
+        return text, (self.width - text.get_width() - 20, 20)
+
+    def render_sector_banner(self, sector):
+        """Sector name and description, word-wrapped to the banner width"""
+        game = self.game
+        banner_width = 400
+        desc = game.sector_descriptions.get(sector)
+        if desc is None and hasattr(sector, "name"):
+            desc = game.sector_descriptions.get(sector.name)
+        if desc is None:
+            desc = "Welcome to the job market!"
+
+        desc_font = game.font_desc
+        max_width = banner_width - 20
+        desc_lines = []
+        line = ""
+        for word in desc.split():
+            test_line = f"{line} {word}".strip()
+            if desc_font.size(test_line)[0] <= max_width:
+                line = test_line
+            else:
+                desc_lines.append(line)
+                line = word
+        if line:
+            desc_lines.append(line)
+
+        banner_height = 30 + 20 * len(desc_lines)
+        widget = pygame.Surface((banner_width, banner_height), pygame.SRCALPHA)
+        banner_rect = widget.get_rect()
+        # Opaque, matching how the translucent fill used to land on the display surface
+        pygame.draw.rect(widget, (0, 0, 0), banner_rect, border_radius=10)
+        pygame.draw.rect(widget, (255, 255, 255), banner_rect, 2, border_radius=10)
+
+        sector_str = game.sector_to_str(sector)
+        sector_text = render_text(game.font_medium, f"SECTOR: {sector_str}", True, (255, 255, 255))
+        widget.blit(sector_text, (10, 5))
+
+        for i, line in enumerate(desc_lines):
+            widget.blit(render_text(desc_font, line, True, (255, 0, 0)), (10, 30 + i * 20))
+
+        return widget, (self.width // 2 - banner_width // 2, 10)
+
+    def render_power_ups(self, active):
+        """List of currently active power-ups"""
+        lines = [render_text(self.game.font_small, label, True, color)
+                 for (_, label, color), on in zip(self.power_up_labels, active) if on]
+        if not lines:
+            return None, (20, 80)
+        widget = pygame.Surface((max(line.get_width() for line in lines), 25 * len(lines)), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            widget.blit(line, (0, i * 25))
+        return widget, (20, 80)
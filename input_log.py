@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import json
+import pygame
+
+LOG_VERSION = 1
+
+# Keys the simulation polls with get_pressed() (Player.update); only these are logged
+POLLED_KEYS = (pygame.K_SPACE, pygame.K_LCTRL)
+
+class InputRecorder:
+    def __init__(self, seed, sim_hz):
+        """Compact input log for one run: key presses and polled-key changes, stamped with sim ticks"""
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.events = []  # [tick, key] for every KEYDOWN handled during play
+        self.keys = []  # [tick, [held keys]] whenever the polled set changes
+        self.held = None
+        self.ticks = 0
+
+    def record_key(self, tick, key):
+        self.events.append([tick, key])
+
+    def record_keys(self, tick, keys):
+        held = [key for key in POLLED_KEYS if keys[key]]
+        if held != self.held:
+            self.held = held
+            self.keys.append([tick, held])
+
+    def save(self, path, ticks, result=None):
+        """Write the log; `result` is the end state a replay should reproduce"""
+        log = {
+            "version": LOG_VERSION,
+            "seed": self.seed,
+            "sim_hz": self.sim_hz,
+            "ticks": ticks,
+            "events": self.events,
+            "keys": self.keys,
+            "result": result or {},
+        }
+        with open(path, "w") as f:
+            json.dump(log, f, separators=(",", ":"))
+        print(f"Input log written to {path} ({ticks} ticks, {len(self.events)} key presses, seed {self.seed})")
+
+class KeyState:
+    """Stand-in for pygame.key.get_pressed() during playback"""
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+class InputPlayback:
+    def __init__(self, log):
+        """Feeds a recorded input log back to the game, tick by tick"""
+        if log.get("version") != LOG_VERSION:
+            raise ValueError(f"Unsupported input log version: {log.get('version')}")
+        self.seed = log["seed"]
+        self.sim_hz = log["sim_hz"]
+        self.ticks = log["ticks"]
+        self.events = log["events"]
+        self.keys = log["keys"]
+        self.result = log.get("result", {})
+        self.event_index = 0
+        self.key_index = 0
+        self.key_state = KeyState()
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def pop_keys(self, tick):
+        """KEYDOWN keys due at or before `tick` that have not been handed out yet"""
+        due = []
+        while self.event_index < len(self.events) and self.events[self.event_index][0] <= tick:
+            due.append(self.events[self.event_index][1])
+            self.event_index += 1
+        return due
+
+    def keys_at(self, tick):
+        """Polled key state for the sim step about to run at `tick`"""
+        while self.key_index < len(self.keys) and self.keys[self.key_index][0] <= tick:
+            self.key_state = KeyState(self.keys[self.key_index][1])
+            self.key_index += 1
+        return self.key_state
+
+    def finished(self, tick):
+        return tick >= self.ticks
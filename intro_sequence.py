@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 import pygame
 import sys
-import time
 import random
+from text_cache import render_text
 
 class IntroSequence:
     def __init__(self, screen, clock, sound_system):
@@ -27,6 +27,7 @@ class IntroSequence:
         # Intro sequence state
         self.current_state = 0
         self.alpha = 0  # For fade effects
+        self.fade_copies = {}  # Shared cached text surface -> our own copy to fade
         self.fade_direction = 1  # 1 for fade in, -1 for fade out
         self.text_y = self.height // 2  # For text animations
         self.player_name = ""
@@ -55,14 +56,11 @@ class IntroSequence:
         
         # Timing
         self.state_timer = 0
-        self.last_time = time.time()
         self.delta_time = 0
         
-    def update(self):
-        # Calculate delta time
-        current_time = time.time()
-        self.delta_time = current_time - self.last_time
-        self.last_time = current_time
+    def update(self, delta_time):
+        """Advance the intro by one frame; returns True once it is complete"""
+        self.delta_time = delta_time
         
         # Update state timer
         self.state_timer += self.delta_time
@@ -114,61 +112,68 @@ class IntroSequence:
             pass
             
         elif self.current_state == 3:
-            # Loading screen
-            self.loading_progress += 25 * self.delta_time
-            if self.loading_progress >= 100:
-                self.loading_progress = 100
-                self.loading_complete = True
-                
-            if self.loading_complete and self.state_timer > 2.0:
+            # Loading screen; stays up until the asset loader catches up
+            if self.loading_complete:
                 return True  # Intro sequence complete
                 
         return False  # Intro sequence not complete
         
+    def set_loading_progress(self, fraction):
+        """Real loading progress (0..1) from the asset loader"""
+        self.loading_progress = min(100, fraction * 100)
+        self.loading_complete = fraction >= 1.0
+        
+    def start_loading(self):
+        """Show the loading bar after the name has been entered"""
+        self.current_state = 3
+        self.state_timer = 0
+        
+    def faded(self, text_surface):
+        """Copy of a cached text surface at the current fade alpha (cached surfaces are shared)"""
+        copy = self.fade_copies.get(text_surface)
+        if copy is None:
+            copy = self.fade_copies[text_surface] = text_surface.copy()
+        copy.set_alpha(self.alpha)
+        return copy
+        
     def draw(self):
         self.screen.fill(self.BLACK)
         
         if self.current_state == 0:
             # First splash screen
-            text_surface = self.font_large.render("WELCOME TO 2025...", True, self.WHITE)
+            text_surface = render_text(self.font_large, "WELCOME TO 2025...", True, self.WHITE)
             text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 3))
-            text_surface.set_alpha(self.alpha)
-            self.screen.blit(text_surface, text_rect)
+            self.screen.blit(self.faded(text_surface), text_rect)
             
-            text_surface2 = self.font_medium.render("WHERE HAVING A DEGREE MEANS YOU'RE", True, self.WHITE)
+            text_surface2 = render_text(self.font_medium, "WHERE HAVING A DEGREE MEANS YOU'RE", True, self.WHITE)
             text_rect2 = text_surface2.get_rect(center=(self.width // 2, self.height // 2))
-            text_surface2.set_alpha(self.alpha)
-            self.screen.blit(text_surface2, text_rect2)
+            self.screen.blit(self.faded(text_surface2), text_rect2)
             
-            text_surface3 = self.font_large.render("OVERQUALIFIED FOR ENTRY-LEVEL JOBS", True, self.RED)
+            text_surface3 = render_text(self.font_large, "OVERQUALIFIED FOR ENTRY-LEVEL JOBS", True, self.RED)
             text_rect3 = text_surface3.get_rect(center=(self.width // 2, self.height // 2 + 50))
-            text_surface3.set_alpha(self.alpha)
-            self.screen.blit(text_surface3, text_rect3)
+            self.screen.blit(self.faded(text_surface3), text_rect3)
             
         elif self.current_state == 1:
             # Second splash screen
-            text_surface = self.font_large.render("THE JOB MARKET SIMULATOR", True, self.WHITE)
+            text_surface = render_text(self.font_large, "THE JOB MARKET SIMULATOR", True, self.WHITE)
             text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 3))
-            text_surface.set_alpha(self.alpha)
-            self.screen.blit(text_surface, text_rect)
+            self.screen.blit(self.faded(text_surface), text_rect)
             
-            text_surface2 = self.font_large.render("NOBODY ASKED FOR...", True, self.WHITE)
+            text_surface2 = render_text(self.font_large, "NOBODY ASKED FOR...", True, self.WHITE)
             text_rect2 = text_surface2.get_rect(center=(self.width // 2, self.height // 2))
-            text_surface2.set_alpha(self.alpha)
-            self.screen.blit(text_surface2, text_rect2)
+            self.screen.blit(self.faded(text_surface2), text_rect2)
             
-            text_surface3 = self.font_large.render("BUT EVERYONE NEEDS", True, self.BLUE)
+            text_surface3 = render_text(self.font_large, "BUT EVERYONE NEEDS", True, self.BLUE)
             text_rect3 = text_surface3.get_rect(center=(self.width // 2, self.height // 2 + 50))
-            text_surface3.set_alpha(self.alpha)
-            self.screen.blit(text_surface3, text_rect3)
+            self.screen.blit(self.faded(text_surface3), text_rect3)
             
         elif self.current_state == 2:
             # Character creation mockup
-            text_surface = self.font_large.render("ENTER YOUR NAME", True, self.WHITE)
+            text_surface = render_text(self.font_large, "ENTER YOUR NAME", True, self.WHITE)
             text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 3))
             self.screen.blit(text_surface, text_rect)
             
-            text_surface2 = self.font_small.render("FOR YOUR INEVITABLE REJECTION LETTERS", True, self.RED)
+            text_surface2 = render_text(self.font_small, "FOR YOUR INEVITABLE REJECTION LETTERS", True, self.RED)
             text_rect2 = text_surface2.get_rect(center=(self.width // 2, self.height // 3 + 40))
             self.screen.blit(text_surface2, text_rect2)
             
@@ -178,7 +183,7 @@ class IntroSequence:
             pygame.draw.rect(self.screen, self.WHITE, input_box, 2)
             
             # Draw entered name
-            name_surface = self.font_medium.render(self.player_name, True, self.WHITE)
+            name_surface = render_text(self.font_medium, self.player_name, True, self.WHITE)
             name_rect = name_surface.get_rect(midleft=(input_box.x + 10, input_box.y + input_box.height // 2))
             self.screen.blit(name_surface, name_rect)
             
@@ -193,13 +198,13 @@ class IntroSequence:
             pygame.draw.rect(self.screen, self.BLUE, continue_box)
             pygame.draw.rect(self.screen, self.WHITE, continue_box, 2)
             
-            continue_text = self.font_medium.render("CONTINUE", True, self.WHITE)
+            continue_text = render_text(self.font_medium, "CONTINUE", True, self.WHITE)
             continue_rect = continue_text.get_rect(center=continue_box.center)
             self.screen.blit(continue_text, continue_rect)
             
         elif self.current_state == 3:
             # Loading screen
-            text_surface = self.font_large.render("LOADING JOB RUSH 2025", True, self.WHITE)
+            text_surface = render_text(self.font_large, "LOADING JOB RUSH 2025", True, self.WHITE)
             text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 3))
             self.screen.blit(text_surface, text_rect)
             
@@ -212,63 +217,51 @@ class IntroSequence:
             pygame.draw.rect(self.screen, self.WHITE, loading_bar_bg, 2)
             
             # Draw loading percentage
-            percent_text = self.font_small.render(f"{int(self.loading_progress)}%", True, self.WHITE)
+            percent_text = render_text(self.font_small, f"{int(self.loading_progress)}%", True, self.WHITE)
             percent_rect = percent_text.get_rect(center=loading_bar_bg.center)
             self.screen.blit(percent_text, percent_rect)
             
             # Draw loading tip
-            tip_text = self.font_medium.render(self.current_tip, True, self.RED)
+            tip_text = render_text(self.font_medium, self.current_tip, True, self.RED)
             tip_rect = tip_text.get_rect(center=(self.width // 2, self.height // 2 + 80))
             self.screen.blit(tip_text, tip_rect)
-            
-            if self.loading_complete:
-                complete_text = self.font_medium.render("PRESS ANY KEY TO START", True, self.WHITE)
-                complete_rect = complete_text.get_rect(center=(self.width // 2, self.height // 2 + 150))
-                
-                # Make it blink
-                if self.typing_cursor_visible:
-                    self.screen.blit(complete_text, complete_rect)
     
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return None
-            elif event.type == pygame.KEYDOWN:
-                if self.current_state == 2:  # Only handle name input in state 2
-                    if event.key == pygame.K_RETURN:
-                        if self.player_name:  # Only proceed if name is not empty
-                            self.sound_system.play_sound("button_click")
-                            return self.player_name
-                    elif event.key == pygame.K_BACKSPACE:
-                        self.sound_system.play_sound("button_click")
-                        self.player_name = self.player_name[:-1]
-                    elif len(self.player_name) < 20:
+    def handle_event(self, event):
+        """Handle one event; returns the player name once it has been entered"""
+        if event.type == pygame.KEYDOWN:
+            if self.current_state == 2:  # Only handle name input in state 2
+                if event.key == pygame.K_RETURN:
+                    if self.player_name:  # Only proceed if name is not empty
                         self.sound_system.play_sound("button_click")
-                        self.player_name += event.unicode
+                        return self.player_name
+                elif event.key == pygame.K_BACKSPACE:
+                    self.sound_system.play_sound("button_click")
+                    self.player_name = self.player_name[:-1]
+                elif len(self.player_name) < 20:
+                    self.sound_system.play_sound("button_click")
+                    self.player_name += event.unicode
         return None
-        
-    def run(self):
-        """Run the intro sequence until completion"""
-        intro_complete = False
-        
-        while not intro_complete:
-            intro_complete = self.handle_events()
-            self.update()
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(60)
-            
-        return self.player_name  # Return the entered player name
 
 if __name__ == "__main__":
     # Test the intro sequence
+    from sound_system import SoundSystem
+    
     pygame.init()
     screen = pygame.display.set_mode((1280, 720))
     pygame.display.set_caption("Job Rush 2025 - Intro Test")
     clock = pygame.time.Clock()
     
-    intro = IntroSequence(screen, clock)
-    player_name = intro.run()
+    intro = IntroSequence(screen, clock, SoundSystem(False))
+    player_name = None
+    while not player_name:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            player_name = intro.handle_event(event) or player_name
+        intro.update(clock.tick(60) / 1000)
+        intro.draw()
+        pygame.display.flip()
     
     print(f"Player name: {player_name}")
     pygame.quit()
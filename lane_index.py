@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import bisect
+
+import pygame
+
+class LaneGroup(pygame.sprite.Group):
+    def __init__(self, lanes=3):
+        """Sprite group that also keeps each lane's sprites ordered by x, for "what is near here?" queries
+
+        Sprites are placed by x when added; call moved() after changing a sprite's x to keep the order.
+        """
+        super().__init__()
+        self.lanes = [[] for _ in range(lanes)]  # Sprites, ordered by their keys
+        self.keys = [[] for _ in range(lanes)]  # Each sprite's x when it was last placed
+        self.placed = {}  # sprite -> key
+        self.max_width = 0  # Widest sprite added; bounds how far left of a point an overlapping sprite can start
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.place(sprite)
+        if sprite.rect.width > self.max_width:
+            self.max_width = sprite.rect.width
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.unplace(sprite)
+
+    def place(self, sprite):
+        keys = self.keys[sprite.lane]
+        i = bisect.bisect_right(keys, sprite.x)
+        keys.insert(i, sprite.x)
+        self.lanes[sprite.lane].insert(i, sprite)
+        self.placed[sprite] = sprite.x
+
+    def index(self, sprite):
+        """Position of a placed sprite in its lane lists"""
+        sprites = self.lanes[sprite.lane]
+        i = bisect.bisect_left(self.keys[sprite.lane], self.placed[sprite])
+        while sprites[i] is not sprite:  # Skip others placed at the same x
+            i += 1
+        return i
+
+    def unplace(self, sprite):
+        i = self.index(sprite)
+        del self.lanes[sprite.lane][i]
+        del self.keys[sprite.lane][i]
+        del self.placed[sprite]
+
+    def moved(self, sprite):
+        """Re-key a sprite after its x changed; it only shifts in its lane if it overtook a neighbour"""
+        if sprite not in self.placed:
+            return  # Killed while updating
+        keys = self.keys[sprite.lane]
+        i = self.index(sprite)
+        x = sprite.x
+        if (i > 0 and keys[i - 1] > x) or (i + 1 < len(keys) and keys[i + 1] < x):
+            self.unplace(sprite)
+            self.place(sprite)
+        else:
+            keys[i] = x
+            self.placed[sprite] = x
+
+    def near(self, lane, left, right):
+        """Sprites in `lane` whose x span may overlap [left, right], left to right"""
+        keys = self.keys[lane]
+        start = bisect.bisect_left(keys, left - self.max_width - 1)
+        end = bisect.bisect_right(keys, right + 1)
+        return self.lanes[lane][start:end]
+
+    def colliding(self, rect, lanes=None):
+        """Sprites in `lanes` (default all) whose rects overlap `rect`"""
+        hits = []
+        for lane in range(len(self.lanes)) if lanes is None else lanes:
+            candidates = self.near(lane, rect.left, rect.right)
+            if candidates:
+                hits.extend(candidates[i] for i in rect.collidelistall([sprite.rect for sprite in candidates]))
+        return hits
@@ -1,45 +1,24 @@
 #!/usr/bin/env python3
+import time
+LAUNCH_TIME = time.perf_counter()  # Time-to-first-frame is measured from here
+
 import pygame
 import sys
-import random
-import json
-import time
-import math
-from enum import Enum
-import os
 
 # Import our enhanced game
 from game_enhanced import Game
-from outro_sequence import OutroSequence
+from sector_cache import SECTOR_CACHE_BYTES
+from sound_system import init_audio
 
-# Initialize pygame
-pygame.init()
+# Initialize only the pygame subsystems the game uses (not joystick, camera, etc.)
+pygame.display.init()
+pygame.font.init()
 
-# Print pygame version and audio driver info
+# Print pygame version
 print(f"Pygame version: {pygame.version.ver}")
-print(f"Pygame audio driver: {pygame.mixer.get_init()}")
 
-# Try to initialize audio with different settings
-audio_available = False
-try:
-    # Try different audio settings
-    pygame.mixer.pre_init(44100, -16, 2, 2048)
-    pygame.mixer.init()
-    
-    # Test if audio is working by loading a sound
-    test_sound = pygame.mixer.Sound("assets/sounds/button_click.wav")
-    test_sound.play()
-    time.sleep(0.1)  # Wait a bit to hear the sound
-    audio_available = True
-    print("Audio system initialized successfully!")
-except pygame.error as e:
-    print(f"Warning: Could not initialize audio: {e}")
-    print("Game will run without sound.")
-    audio_available = False
-except Exception as e:
-    print(f"Warning: Unexpected error during audio initialization: {e}")
-    print("Game will run without sound.")
-    audio_available = False
+# Open the audio device once; SoundSystem reuses it
+audio_available = init_audio()
 
 # Constants
 SCREEN_WIDTH = 1280
@@ -51,14 +30,36 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Job Rush 2025 @ Lhasang T Lama")
 clock = pygame.time.Clock()
 
+def arg_value(flag):
+    """Value following `flag` on the command line, or None"""
+    if flag in sys.argv and sys.argv.index(flag) + 1 < len(sys.argv):
+        return sys.argv[sys.argv.index(flag) + 1]
+    return None
+
 def main():
     # Create and run the game
-    game = Game(screen, clock, audio_available)
+    # --dirty-rects pushes only changed screen areas (helps low-end machines)
+    # --profile writes per-phase frame timings to profile_report.json on exit
+    # --seed N reproduces a run; --record FILE saves its input, --replay FILE plays it back
+    # --background-cache-mb N caps the memory kept for built sector backgrounds (~32 MB each)
+    seed = arg_value("--seed")
+    cache_mb = arg_value("--background-cache-mb")
+    replay_path = arg_value("--replay")
+    if replay_path:
+        from input_log import InputPlayback
+    game = Game(screen, clock, audio_available,
+                dirty_rects="--dirty-rects" in sys.argv,
+                profile_report_path="profile_report.json" if "--profile" in sys.argv else None,
+                seed=int(seed) if seed is not None else None,
+                record_path=arg_value("--record"),
+                playback=InputPlayback.load(replay_path) if replay_path else None,
+                launch_time=LAUNCH_TIME,
+                background_cache_bytes=int(float(cache_mb) * 1024 * 1024) if cache_mb else SECTOR_CACHE_BYTES)
+    print(f"Run seed: {game.seed}")
+    # The outro runs as the game's last scene
     result = game.run()
 
     if result == "quit":
-        outro = OutroSequence(screen, clock)
-        outro.run()
         pygame.quit()
         sys.exit()
 
@@ -1,6 +1,5 @@
 import pygame
 import sys
-import time
 import textwrap
 
 class OutroSequence:
@@ -16,12 +15,9 @@ class OutroSequence:
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
-        self.state = 0
-        self.alpha = 0
-        self.fade_direction = 1
-        self.state_timer = 0
-        self.last_time = time.time()
-        self.delta_time = 0
+        self.hold_time = 1.5  # Seconds each line stays fully visible
+        self.end_wait = 1.0  # Seconds of black after the last line
+        self.reset()
 
         self.outro_lines = [
             ("THANK YOU FOR PLAYING JOB RUSH 2025!", self.WHITE),
@@ -32,35 +28,41 @@ class OutroSequence:
             ("See you in the next round of layoffs!", self.RED),
         ]
 
-    def run(self):
-        for text, color in self.outro_lines:
-            self.state_timer = 0
-            self.alpha = 0
-            self.fade_direction = 1
-            while self.alpha < 255:
-                self.update()
-                self.draw(text, color)
-                pygame.display.flip()
-                self.clock.tick(60)
-            time.sleep(1.5)
-            self.fade_direction = -1
-            while self.alpha > 0:
-                self.update()
-                self.draw(text, color)
-                pygame.display.flip()
-                self.clock.tick(60)
-        # Wait a moment before quitting
-        time.sleep(1.0)
+    def reset(self):
+        """Start again from the first line"""
+        self.line_index = 0
+        self.alpha = 0
+        self.fade_direction = 1  # 1 fading in, 0 holding, -1 fading out
+        self.state_timer = 0
+        self.delta_time = 0
 
-    def update(self):
-        current_time = time.time()
-        self.delta_time = current_time - self.last_time
-        self.last_time = current_time
-        self.alpha += self.fade_direction * 255 * self.delta_time
+    def update(self, delta_time):
+        """Advance the fades by one frame; returns True when the outro is over"""
+        self.delta_time = delta_time
+        self.state_timer += delta_time
+        if self.line_index >= len(self.outro_lines):
+            # Wait a moment before quitting
+            return self.state_timer >= self.end_wait
+
+        self.alpha += self.fade_direction * 255 * delta_time
         self.alpha = max(0, min(255, self.alpha))
+        if self.fade_direction == 1 and self.alpha >= 255:
+            self.fade_direction = 0
+            self.state_timer = 0
+        elif self.fade_direction == 0 and self.state_timer >= self.hold_time:
+            self.fade_direction = -1
+        elif self.fade_direction == -1 and self.alpha <= 0:
+            # Next line
+            self.line_index += 1
+            self.fade_direction = 1
+            self.state_timer = 0
+        return False
 
-    def draw(self, text, color):
+    def draw(self):
         self.screen.fill((0, 0, 0))
+        if self.line_index >= len(self.outro_lines):
+            return
+        text, color = self.outro_lines[self.line_index]
         max_width = int(self.width * 0.85)
         lines = self.wrap_text(text, self.font_large, max_width)
         total_height = len(lines) * (self.font_large.get_height() + 10)
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 import pygame
-import random
+from rng import stream
 import math
+from entity_types import entity_types
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, sprite_manager, particle_system, lane_positions):
@@ -9,6 +10,8 @@ class Player(pygame.sprite.Sprite):
         self.sprite_manager = sprite_manager
         self.particle_system = particle_system
         self.lane_positions = lane_positions
+        self.random = stream("player")
+        self.effects_random = stream("effects")  # Cosmetic only; kept apart from gameplay draws
         self.current_lane = 1  # Start in the middle lane
         
         # Load player sprites
@@ -18,6 +21,11 @@ class Player(pygame.sprite.Sprite):
         self.rect.x = 200
         self.rect.bottom = 600  # Adjust as needed for your ground level
         
+        # Float vertical position; rect.y is rounded from it every update
+        self.y = float(self.rect.y)
+        self.prev_y = self.y  # Position at the previous sim step, for interpolation
+        self.lane_change_speed = 600  # pixels/sec (10px per frame at 60 FPS)
+        
         # Animation state
         self.state = "idle"
         self.frame = 0
@@ -64,6 +72,8 @@ class Player(pygame.sprite.Sprite):
         self.sound_system = sound_system
 
     def update(self, dt, keys):
+        self.prev_y = self.y
+        
         # Handle input
         if not self.is_jumping and not self.is_sliding and keys[pygame.K_SPACE]:
             self.is_jumping = True
@@ -75,9 +85,9 @@ class Player(pygame.sprite.Sprite):
         # Physics
         if self.is_jumping:
             self.velocity_y += self.gravity * dt
-            self.rect.y += int(self.velocity_y * dt)
-            if self.rect.bottom >= 600:  # Ground level
-                self.rect.bottom = 600
+            self.y += self.velocity_y * dt
+            if self.y + self.rect.height >= 600:  # Ground level
+                self.y = 600 - self.rect.height
                 self.is_jumping = False
                 self.velocity_y = 0
 
@@ -87,11 +97,13 @@ class Player(pygame.sprite.Sprite):
                 self.is_sliding = False
 
         # Update lane position
-        target_y = self.lane_positions[self.current_lane]
-        if self.rect.centery < target_y:
-            self.rect.centery = min(self.rect.centery + 10, target_y)
-        elif self.rect.centery > target_y:
-            self.rect.centery = max(self.rect.centery - 10, target_y)
+        target_y = self.lane_positions[self.current_lane] - self.rect.height / 2
+        lane_step = self.lane_change_speed * dt
+        if self.y < target_y:
+            self.y = min(self.y + lane_step, target_y)
+        elif self.y > target_y:
+            self.y = max(self.y - lane_step, target_y)
+        self.rect.y = round(self.y)
 
         # Animation state
         if self.is_jumping:
@@ -112,17 +124,15 @@ class Player(pygame.sprite.Sprite):
         if self.has_bootcamp_speed:
             self.mental_health -= 5 * dt
             
-            # Add anxiety particles occasionally
-            if random.random() < 0.2:
+            # Add anxiety particles occasionally (20% per frame at 60 FPS)
+            if self.random.random() < 12 * dt:
                 self.particle_system.add_anxiety_sparks(self.rect.centerx, self.rect.centery, 2)
             
         if self.power_up_timer > 0:
             self.power_up_timer -= dt
             if self.power_up_timer <= 0:
-                self.has_nepotism_pass = False
-                self.has_linkedin_premium = False
-                self.has_mentorship_shield = False
-                self.has_bootcamp_speed = False
+                for kind in entity_types.power_ups.values():
+                    setattr(self, kind.flag, False)
                 
         # Anxiety sparks when mental health is low
         self.anxiety_timer += dt
@@ -140,10 +150,14 @@ class Player(pygame.sprite.Sprite):
             self.flash_timer -= dt
         if self.shake_timer > 0:
             self.shake_timer -= dt
-            self.shake_offset = (random.randint(-6, 6), random.randint(-6, 6))
+            self.shake_offset = (self.effects_random.randint(-6, 6), self.effects_random.randint(-6, 6))
         else:
             self.shake_offset = (0, 0)
         
+    def get_render_pos(self, alpha):
+        """Top-left draw position interpolated between the last two sim steps"""
+        return (self.rect.x, round(self.prev_y + (self.y - self.prev_y) * alpha))
+        
     def change_lane(self, direction):
         """Change the player's lane"""
         if direction == "up" and self.current_lane > 0:
@@ -174,22 +188,15 @@ class Player(pygame.sprite.Sprite):
         # Reset hitbox and animation
         
     def activate_power_up(self, power_up_type):
-        self.power_up_timer = 10
+        kind = entity_types.power_ups[power_up_type]
+        self.power_up_timer = kind.duration
         if self.sound_system:
-            self.sound_system.play_sound(power_up_type)
-        
-        if power_up_type == "nepotism_pass":
-            self.has_nepotism_pass = True
-            # Add money particles
-            self.particle_system.add_money_particles(self.rect.centerx, self.rect.centery, 15)
-        elif power_up_type == "linkedin_premium":
-            self.has_linkedin_premium = True
-            # Add diploma particles
-            self.particle_system.add_diploma_particles(self.rect.centerx, self.rect.centery, 10)
-        elif power_up_type == "mentorship_shield":
-            self.has_mentorship_shield = True
-        elif power_up_type == "bootcamp_speed":
-            self.has_bootcamp_speed = True
+            self.sound_system.play_sound(kind.sound)
+        
+        setattr(self, kind.flag, True)
+        if kind.particle_effect:
+            # e.g. money particles for the nepotism pass
+            getattr(self.particle_system, kind.particle_effect)(self.rect.centerx, self.rect.centery, kind.particle_count)
             
     def take_damage(self, amount):
         """Take mental health damage and show stress particles"""
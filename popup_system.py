@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 import pygame
-import random
+from rng import stream
 import json
 import os
 from corporate_jargon import CorporateJargonGenerator
+from text_cache import render_text
+from render_system import get_overlay
 
 class PopupSystem:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, jargon_generator=None):
         """Initialize popup system for job postings and rejection letters"""
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.random = stream("popups")
         
         # Popup state
         self.active_popup = None
@@ -28,8 +31,8 @@ class PopupSystem:
         self.font_medium = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 18)
         
-        # Load jargon generator
-        self.jargon_generator = CorporateJargonGenerator()
+        # Load jargon generator (shared with the game when it passes one in)
+        self.jargon_generator = jargon_generator or CorporateJargonGenerator()
         
         # Popup templates
         self.job_posting_templates = [
@@ -87,8 +90,8 @@ class PopupSystem:
     def show_job_posting(self, duration=5.0):
         """Show a random job posting popup"""
         # Either use a template or generate a new one
-        if random.random() < 0.5:
-            job_template = random.choice(self.job_posting_templates)
+        if self.random.random() < 0.5:
+            job_template = self.random.choice(self.job_posting_templates)
             job_posting = job_template.copy()
         else:
             job_posting = self.jargon_generator.generate_job_posting()
@@ -105,7 +108,7 @@ class PopupSystem:
         
     def show_rejection_letter(self, duration=5.0):
         """Show a random rejection letter popup"""
-        rejection_text = random.choice(self.rejection_templates)
+        rejection_text = self.random.choice(self.rejection_templates)
         
         self.active_popup = {
             "type": "rejection",
@@ -153,7 +156,7 @@ class PopupSystem:
             "content": {
                 "score": score,
                 "sector": sector,
-                "rejection": random.choice(self.rejection_templates)
+                "rejection": self.random.choice(self.rejection_templates)
             }
         }
         self.popup_timer = 0
@@ -175,8 +178,7 @@ class PopupSystem:
             return
             
         # Draw popup background with semi-transparency
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Semi-transparent black
+        overlay = get_overlay((self.screen_width, self.screen_height), (0, 0, 0, 180))  # Semi-transparent black
         surface.blit(overlay, (0, 0))
         
         if self.active_popup["type"] == "job_posting":
@@ -205,30 +207,30 @@ class PopupSystem:
         header_rect = pygame.Rect(popup_x, popup_y, popup_width, 40)
         pygame.draw.rect(surface, self.BLUE, header_rect)
         
-        header_text = self.font_large.render("NEW JOB OPPORTUNITY!", True, self.WHITE)
+        header_text = render_text(self.font_large, "NEW JOB OPPORTUNITY!", True, self.WHITE)
         surface.blit(header_text, (popup_x + 10, popup_y + 10))
         
         # Draw job title
-        title_text = self.font_medium.render(job["title"], True, self.WHITE)
+        title_text = render_text(self.font_medium, job["title"], True, self.WHITE)
         surface.blit(title_text, (popup_x + 10, popup_y + 50))
         
         # Draw description
-        desc_text = self.font_small.render(job["description"], True, self.WHITE)
+        desc_text = render_text(self.font_small, job["description"], True, self.WHITE)
         surface.blit(desc_text, (popup_x + 10, popup_y + 80))
         
         # Draw requirements
         req_y = popup_y + 120
-        req_header = self.font_medium.render("Requirements:", True, self.RED)
+        req_header = render_text(self.font_medium, "Requirements:", True, self.RED)
         surface.blit(req_header, (popup_x + 10, req_y))
         req_y += 30
         
         for req in job["requirements"]:
-            req_text = self.font_small.render(f"• {req}", True, self.WHITE)
+            req_text = render_text(self.font_small, f"• {req}", True, self.WHITE)
             surface.blit(req_text, (popup_x + 20, req_y))
             req_y += 25
             
         # Draw close button
-        close_text = self.font_small.render("Click anywhere to close", True, self.WHITE)
+        close_text = render_text(self.font_small, "Click anywhere to close", True, self.WHITE)
         surface.blit(close_text, (popup_x + popup_width - close_text.get_width() - 10, popup_y + popup_height - 30))
         
     def draw_rejection_letter(self, surface):
@@ -248,7 +250,7 @@ class PopupSystem:
         header_rect = pygame.Rect(popup_x, popup_y, popup_width, 40)
         pygame.draw.rect(surface, self.RED, header_rect)
         
-        header_text = self.font_large.render("APPLICATION STATUS UPDATE", True, self.WHITE)
+        header_text = render_text(self.font_large, "APPLICATION STATUS UPDATE", True, self.WHITE)
         surface.blit(header_text, (popup_x + 10, popup_y + 10))
         
         # Draw rejection text (word wrapped)
@@ -271,12 +273,12 @@ class PopupSystem:
             
         text_y = popup_y + 60
         for line in lines:
-            line_text = self.font_medium.render(line, True, self.WHITE)
+            line_text = render_text(self.font_medium, line, True, self.WHITE)
             surface.blit(line_text, (popup_x + 20, text_y))
             text_y += 30
             
         # Draw close button
-        close_text = self.font_small.render("Click anywhere to close", True, self.WHITE)
+        close_text = render_text(self.font_small, "Click anywhere to close", True, self.WHITE)
         surface.blit(close_text, (popup_x + popup_width - close_text.get_width() - 10, popup_y + popup_height - 30))
         
     def draw_sector_transition(self, surface):
@@ -293,11 +295,11 @@ class PopupSystem:
         pygame.draw.rect(surface, self.WHITE, (popup_x, popup_y, popup_width, popup_height), 2)
         
         # Draw header
-        header_text = self.font_large.render(f"SECTOR TRANSITION: {transition['from']} → {transition['to']}", True, self.WHITE)
+        header_text = render_text(self.font_large, f"SECTOR TRANSITION: {transition['from']} → {transition['to']}", True, self.WHITE)
         surface.blit(header_text, (popup_x + (popup_width - header_text.get_width()) // 2, popup_y + 20))
         
         # Draw transition text
-        trans_text = self.font_medium.render(transition["text"], True, self.RED)
+        trans_text = render_text(self.font_medium, transition["text"], True, self.RED)
         surface.blit(trans_text, (popup_x + (popup_width - trans_text.get_width()) // 2, popup_y + 70))
         
         # Draw progress bar
@@ -327,26 +329,26 @@ class PopupSystem:
         header_rect = pygame.Rect(popup_x, popup_y, popup_width, 50)
         pygame.draw.rect(surface, self.RED, header_rect)
         
-        header_text = self.font_large.render("REJECTION LETTER GENERATOR", True, self.WHITE)
+        header_text = render_text(self.font_large, "REJECTION LETTER GENERATOR", True, self.WHITE)
         surface.blit(header_text, (popup_x + (popup_width - header_text.get_width()) // 2, popup_y + 15))
         
         # Draw score
-        score_text = self.font_medium.render(f"Final Score: {int(game_over['score'])} Synergy Points", True, self.WHITE)
+        score_text = render_text(self.font_medium, f"Final Score: {int(game_over['score'])} Synergy Points", True, self.WHITE)
         surface.blit(score_text, (popup_x + 20, popup_y + 70))
         
         # Draw sector
-        sector_text = self.font_medium.render(f"Final Sector: {game_over['sector']}", True, self.WHITE)
+        sector_text = render_text(self.font_medium, f"Final Sector: {game_over['sector']}", True, self.WHITE)
         surface.blit(sector_text, (popup_x + 20, popup_y + 100))
         
         # Draw divider
         pygame.draw.line(surface, self.WHITE, (popup_x + 20, popup_y + 130), (popup_x + popup_width - 20, popup_y + 130), 2)
         
         # Draw rejection letter header
-        letter_header = self.font_medium.render("Your Official Rejection Letter:", True, self.RED)
+        letter_header = render_text(self.font_medium, "Your Official Rejection Letter:", True, self.RED)
         surface.blit(letter_header, (popup_x + 20, popup_y + 150))
         
         # Draw AI review note
-        ai_text = self.font_small.render("Your application was reviewed by our AI (a magic 8-ball)", True, self.WHITE)
+        ai_text = render_text(self.font_small, "Your application was reviewed by our AI (a magic 8-ball)", True, self.WHITE)
         surface.blit(ai_text, (popup_x + 20, popup_y + 180))
         
         # Draw rejection text (word wrapped)
@@ -369,7 +371,7 @@ class PopupSystem:
             
         text_y = popup_y + 210
         for line in lines:
-            line_text = self.font_medium.render(line, True, self.WHITE)
+            line_text = render_text(self.font_medium, line, True, self.WHITE)
             surface.blit(line_text, (popup_x + 20, text_y))
             text_y += 30
             
@@ -378,11 +380,11 @@ class PopupSystem:
         pygame.draw.rect(surface, self.BLUE, share_box)
         pygame.draw.rect(surface, self.WHITE, share_box, 2)
         
-        share_text = self.font_medium.render("Share Your Failure", True, self.WHITE)
+        share_text = render_text(self.font_medium, "Share Your Failure", True, self.WHITE)
         surface.blit(share_text, (share_box.x + (share_box.width - share_text.get_width()) // 2, share_box.y + 10))
         
         # Draw hashtags
-        hashtag_text = self.font_small.render("#JobRushSurvival #AmazonQCLI", True, self.WHITE)
+        hashtag_text = render_text(self.font_small, "#JobRushSurvival #AmazonQCLI", True, self.WHITE)
         surface.blit(hashtag_text, (popup_x + (popup_width - hashtag_text.get_width()) // 2, popup_y + 370))
         
     def handle_click(self, pos):
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+import json
+import time
+from collections import deque
+
+import pygame
+
+class _Section:
+    """Reusable timing context for one named phase"""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        frame = self.profiler.current
+        frame[self.name] = frame.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+class FrameProfiler:
+    def __init__(self, window=300, bucket_ms=1, max_ms=100, spike_count=20):
+        """Per-phase frame timings with rolling percentiles and a session histogram"""
+        self.window = window
+        self.bucket_ms = bucket_ms
+        self.max_ms = max_ms
+
+        # Rolling per-phase samples (ms), including "frame" for the whole frame
+        self.samples = {}
+        self.sections = {}
+        self.current = {}
+        self.frame_start = None
+        self.last_frame_ms = None  # Duration of the last finished frame, for load-adaptive systems
+        self.events = []  # Things that happened this frame, e.g. a sector transition
+
+        # Session-wide data
+        self.frame_count = 0
+        self.histograms = {}  # phase -> {bucket: count}
+        self.spikes = []  # Slowest frames with their breakdown
+        self.spike_count = spike_count
+        self.event_frames = []  # Breakdown of every frame that had an event
+        self.session_start = time.perf_counter()
+
+        # Cold start: milestones in ms since launch_time (set by the launcher), e.g. "first_frame"
+        self.launch_time = None
+        self.startup = {}
+
+        # Overlay
+        self.show_overlay = False
+        self.overlay_font = None
+        self.overlay_surface = None
+        self.overlay_timer = 0.0
+        self.overlay_interval = 0.5  # Seconds between overlay refreshes
+
+    def section(self, name):
+        """Context manager timing one phase of the current frame"""
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = _Section(self, name)
+        return section
+
+    def mark(self, event):
+        """Tag the current frame with an event so spikes can be explained"""
+        self.events.append(event)
+
+    def startup_mark(self, name):
+        """Record how long after launch a startup milestone was reached"""
+        if self.launch_time is not None and name not in self.startup:
+            self.startup[name] = round((time.perf_counter() - self.launch_time) * 1000, 3)
+            return self.startup[name]
+        return None
+
+    def begin_frame(self):
+        self.current = {}
+        self.events = []
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        self.frame_start = None
+        self.last_frame_ms = frame_ms
+        self.frame_count += 1
+        if self.frame_count == 1 and self.startup_mark("first_frame") is not None:
+            print(f"Time to first frame: {self.startup['first_frame']:.1f} ms")
+
+        breakdown = {name: seconds * 1000 for name, seconds in self.current.items()}
+        breakdown["frame"] = frame_ms
+        for name, ms in breakdown.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(ms)
+            bucket = min(int(ms // self.bucket_ms), self.max_ms // self.bucket_ms)
+            histogram = self.histograms.setdefault(name, {})
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+        record = None
+        if self.events:
+            record = self.make_record(breakdown)
+            self.event_frames.append(record)
+        if len(self.spikes) < self.spike_count or frame_ms > self.spikes[-1]["frame_ms"]:
+            self.spikes.append(record or self.make_record(breakdown))
+            self.spikes.sort(key=lambda spike: spike["frame_ms"], reverse=True)
+            del self.spikes[self.spike_count:]
+
+    def make_record(self, breakdown):
+        return {
+            "frame": self.frame_count,
+            "time": round(time.perf_counter() - self.session_start, 3),
+            "frame_ms": round(breakdown["frame"], 3),
+            "events": list(self.events),
+            "phases": {name: round(ms, 3) for name, ms in breakdown.items() if name != "frame"},
+        }
+
+    def percentiles(self, name):
+        """Rolling (p50, p95, p99) in ms for a phase"""
+        samples = self.samples.get(name)
+        if not samples:
+            return (0.0, 0.0, 0.0)
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[min(last, int(round(p * last)))] for p in (0.50, 0.95, 0.99))
+
+    def get_summary(self):
+        return {name: dict(zip(("p50", "p95", "p99"), (round(v, 3) for v in self.percentiles(name))))
+                for name in self.samples}
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.overlay_surface = None
+
+    def update_overlay(self, delta_time):
+        self.overlay_timer += delta_time
+
+    def draw_overlay(self, surface):
+        """Draw the p50/p95/p99 table; returns the rect drawn, or None"""
+        if not self.show_overlay:
+            return None
+        # Numbers change every frame; only rebuild the table a couple of times a second
+        if self.overlay_surface is None or self.overlay_timer >= self.overlay_interval:
+            self.overlay_timer = 0.0
+            self.overlay_surface = self.build_overlay()
+        pos = (10, surface.get_height() - self.overlay_surface.get_height() - 10)
+        surface.blit(self.overlay_surface, pos)
+        return self.overlay_surface.get_rect(topleft=pos)
+
+    def build_overlay(self):
+        if self.overlay_font is None:
+            self.overlay_font = pygame.font.Font(None, 20)
+        font = self.overlay_font
+        names = ["frame"] + sorted(name for name in self.samples if name != "frame")
+        rows = [("phase (ms)", "p50", "p95", "p99")]
+        for name in names:
+            rows.append((name,) + tuple(f"{value:.2f}" for value in self.percentiles(name)))
+
+        # The default font is proportional, so lay out columns explicitly
+        name_width = max(font.size(row[0])[0] for row in rows) + 12
+        column_width = max(font.size(cell)[0] for row in rows for cell in row[1:]) + 12
+        line_height = 16
+        overlay = pygame.Surface((name_width + 3 * column_width + 16, line_height * len(rows) + 10), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 190))
+        for i, row in enumerate(rows):
+            color = (255, 255, 0) if i == 0 else (255, 255, 255)
+            y = 5 + i * line_height
+            overlay.blit(font.render(row[0], True, color), (8, y))
+            for j, cell in enumerate(row[1:]):
+                text = font.render(cell, True, color)
+                overlay.blit(text, (8 + name_width + (j + 1) * column_width - text.get_width(), y))
+        return overlay
+
+    def write_report(self, path):
+        """Write percentiles, per-phase frame-time histograms and spike frames as JSON"""
+        report = {
+            "frames": self.frame_count,
+            "duration": round(time.perf_counter() - self.session_start, 3),
+            "bucket_ms": self.bucket_ms,
+            "startup": self.startup,
+            "percentiles": self.get_summary(),
+            "histograms": {name: {str(bucket * self.bucket_ms): count for bucket, count in sorted(histogram.items())}
+                           for name, histogram in self.histograms.items()},
+            "spikes": self.spikes,
+            "event_frames": self.event_frames,
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Frame profile written to {path}")
+        return report
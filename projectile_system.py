@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+import numpy as np
+
+class ProjectileSystem:
+    def __init__(self, capacity=512):
+        """Every live projectile in fixed-size arrays, updated, culled, collided and drawn in batches
+
+        Slots are reused in place (the arrays are the pool); spawns beyond `capacity` are dropped.
+        """
+        self.capacity = capacity
+        self.x = np.zeros(capacity)  # Left edge, float
+        self.prev_x = np.zeros(capacity)  # Left edge at the previous sim step, for interpolation
+        self.y = np.zeros(capacity, dtype=np.int64)  # Top edge
+        self.width = np.zeros(capacity, dtype=np.int64)
+        self.height = np.zeros(capacity, dtype=np.int64)
+        self.speed = np.zeros(capacity)
+        self.damage = np.zeros(capacity, dtype=np.int64)
+        self.images = [None] * capacity
+        self.count = 0
+
+        # Stats
+        self.high_water = 0
+        self.dropped = 0  # Spawns refused because every slot was taken
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.images[:self.count] = [None] * self.count
+        self.count = 0
+
+    def spawn(self, right, centery, speed, image, damage):
+        """Add a projectile whose right edge starts at `right`; returns False if at capacity"""
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return False
+        i = self.count
+        width, height = image.get_size()
+        self.x[i] = self.prev_x[i] = float(right - width)
+        self.y[i] = centery - height // 2
+        self.width[i] = width
+        self.height[i] = height
+        self.speed[i] = speed
+        self.damage[i] = damage
+        self.images[i] = image
+        self.count += 1
+        if self.count > self.high_water:
+            self.high_water = self.count
+        return True
+
+    def update(self, delta_time):
+        """Move every projectile left and drop the ones that left the screen"""
+        n = self.count
+        if not n:
+            return
+        x = self.x[:n]
+        self.prev_x[:n] = x
+        x -= self.speed[:n] * delta_time
+        gone = np.rint(x) + self.width[:n] < 0
+        if gone.any():
+            self.remove(gone)
+
+    def collide(self, rect):
+        """Remove the projectiles overlapping `rect` and return their damage values, oldest first"""
+        n = self.count
+        if not n:
+            return []
+        left = np.rint(self.x[:n])
+        top = self.y[:n]
+        hits = ((left < rect.right) & (left + self.width[:n] > rect.left)
+                & (top < rect.bottom) & (top + self.height[:n] > rect.top))
+        if not hits.any():
+            return []
+        damage = self.damage[:n][hits].tolist()
+        self.remove(hits)
+        return damage
+
+    def remove(self, mask):
+        """Drop the slots set in `mask` (length count), keeping the rest packed and in order"""
+        n = self.count
+        keep = ~mask
+        kept = int(keep.sum())
+        for array in (self.x, self.prev_x, self.y, self.width, self.height, self.speed, self.damage):
+            array[:kept] = array[:n][keep]
+        images = self.images
+        images[:kept] = [image for image, k in zip(images[:n], keep) if k]
+        images[kept:n] = [None] * (n - kept)
+        self.count = kept
+
+    def commands(self, alpha=1.0):
+        """(image, pos) blits for every projectile at its interpolated position"""
+        n = self.count
+        if not n:
+            return []
+        prev_x = self.prev_x[:n]
+        xs = np.rint(prev_x + (self.x[:n] - prev_x) * alpha).astype(np.int64).tolist()
+        return list(zip(self.images[:n], zip(xs, self.y[:n].tolist())))
+
+    def draw(self, surface, alpha=1.0):
+        """Blit every projectile at its interpolated position; returns the rects drawn"""
+        return surface.blits(self.commands(alpha))
+
+    def stats(self):
+        return {"active": self.count, "capacity": self.capacity, "high_water": self.high_water,
+                "dropped": self.dropped}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+from contextlib import nullcontext
+
+import pygame
+
+class DirtyRectRenderer:
+    def __init__(self, screen, full_flip_ratio=0.5):
+        """Push only the changed parts of the screen to the display"""
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.screen_area = self.screen_rect.width * self.screen_rect.height
+
+        # Above this fraction of the screen, one flip is cheaper than many updates
+        self.full_flip_ratio = full_flip_ratio
+
+        self.dirty = []  # Rects changed this frame
+        self.prev_dirty = []  # Rects drawn last frame (their old pixels need replacing)
+        self.full_redraw = True  # Start with one full frame
+
+        # Stats
+        self.frames = 0
+        self.full_flips = 0
+        self.partial_updates = 0
+        self.skipped_frames = 0
+        self.rects_pushed = 0
+
+    def invalidate(self):
+        """Force the next present to push the whole screen"""
+        self.full_redraw = True
+
+    def needs_redraw(self):
+        """Whether anything has been marked since the last present"""
+        return self.full_redraw or bool(self.dirty)
+
+    def add(self, rect):
+        """Mark a screen area as changed this frame"""
+        if rect is None:
+            return
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width > 0 and rect.height > 0:
+            self.dirty.append(rect)
+
+    def add_all(self, rects):
+        for rect in rects:
+            self.add(rect)
+
+    def present(self):
+        """Send this frame's changes to the display"""
+        self.frames += 1
+
+        if self.full_redraw:
+            self._flip()
+        else:
+            # Old positions must be refreshed as well as new ones
+            rects = self.prev_dirty + self.dirty
+            if not rects:
+                self.skipped_frames += 1
+            elif sum(r.width * r.height for r in rects) > self.screen_area * self.full_flip_ratio:
+                self._flip()
+            else:
+                pygame.display.update(rects)
+                self.partial_updates += 1
+                self.rects_pushed += len(rects)
+
+        self.prev_dirty = self.dirty
+        self.dirty = []
+
+    def _flip(self):
+        pygame.display.flip()
+        self.full_flips += 1
+        self.full_redraw = False
+
+    def get_stats(self):
+        return {
+            "frames": self.frames,
+            "full_flips": self.full_flips,
+            "partial_updates": self.partial_updates,
+            "skipped_frames": self.skipped_frames,
+            "rects_pushed": self.rects_pushed,
+        }
+
+class RenderQueue:
+    def __init__(self, layers, grouped=(), sections=None):
+        """Per-frame blit commands, submitted back to front with one batched call per layer
+
+        `layers` names the layers in draw order. In `grouped` layers, commands that share a source
+        surface are drawn together, in the order each surface was first queued; only group layers
+        whose draws may overlap in any order. Other layers keep queue order. `sections` maps layers
+        to the profiler section their submit is timed under (default: the layer name).
+        """
+        self.layers = {name: [] for name in layers}
+        self.grouped = set(grouped)
+        self.sections = sections or {}
+
+        # Stats
+        self.frames = 0
+        self.commands = 0  # Blits submitted by the last flush
+        self.submits = 0  # Batched calls made by the last flush
+        self.total_commands = 0
+        self.max_commands = 0
+
+    def add(self, layer, image, pos):
+        self.layers[layer].append((image, pos))
+
+    def extend(self, layer, commands):
+        """Queue (image, pos) pairs"""
+        self.layers[layer].extend(commands)
+
+    def flush(self, surface, profiler=None):
+        """Draw every queued command onto `surface` and empty the queue, timing each layer with `profiler`"""
+        commands = submits = 0
+        for name, queued in self.layers.items():
+            if not queued:
+                continue
+            with profiler.section(self.sections.get(name, name)) if profiler else nullcontext():
+                if name in self.grouped and len(queued) > 1:
+                    first_seen = {}
+                    queued.sort(key=lambda command: first_seen.setdefault(command[0], len(first_seen)))
+                submit(surface, queued)
+            commands += len(queued)
+            submits += 1
+            queued.clear()
+        self.frames += 1
+        self.commands = commands
+        self.submits = submits
+        self.total_commands += commands
+        self.max_commands = max(self.max_commands, commands)
+
+    def get_stats(self):
+        return {
+            "frames": self.frames,
+            "commands": self.commands,
+            "submits": self.submits,
+            "avg_commands": round(self.total_commands / self.frames, 1) if self.frames else 0.0,
+            "max_commands": self.max_commands,
+        }
+
+def submit(surface, commands):
+    """Blit (image, pos) pairs in one call: fblits where pygame has it, else blits without rects"""
+    if hasattr(surface, "fblits"):
+        surface.fblits(commands)
+    else:
+        surface.blits(commands, False)
+
+class OverlayCache:
+    def __init__(self):
+        """Solid translucent layers (screen dimmers etc.), built once per size and color"""
+        self.overlays = {}
+
+    def get(self, size, color):
+        """Return a cached SRCALPHA surface of `size` filled with RGBA `color`"""
+        key = (tuple(size), tuple(color))
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(key[0], pygame.SRCALPHA)
+            overlay.fill(key[1])
+            if pygame.display.get_surface() is not None:
+                # Match the display pixel format for faster blits
+                overlay = overlay.convert_alpha()
+            self.overlays[key] = overlay
+        return overlay
+
+    def clear(self):
+        """Drop every overlay; call when the display mode changes"""
+        self.overlays.clear()
+
+# Shared by all screens
+overlay_cache = OverlayCache()
+
+def get_overlay(size, color):
+    """Fetch a pre-filled overlay from the shared cache"""
+    return overlay_cache.get(size, color)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+import random
+import time
+
+class RNGService:
+    def __init__(self, seed=None):
+        """Independent, reproducible random streams per subsystem, derived from one run seed"""
+        self.streams = {}  # name -> random.Random
+        self.seed = None
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Start a new run; every stream (existing or future) restarts from `seed`.
+
+        With no seed a fresh one is picked from the clock. Streams are reseeded
+        in place, so modules holding on to a stream stay in sync.
+        """
+        if seed is None:
+            seed = time.time_ns() & 0xFFFFFFFF
+        self.seed = seed
+        for name, stream in self.streams.items():
+            stream.seed(self.stream_seed(name))
+        return seed
+
+    def stream_seed(self, name):
+        # String seeds are hashed (SHA-512) by random.Random, so this is stable across runs and platforms
+        return f"{self.seed}:{name}"
+
+    def stream(self, name):
+        """The random.Random for one subsystem; draws from it never shift other streams"""
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams[name] = random.Random(self.stream_seed(name))
+        return stream
+
+    def get_state(self):
+        """Snapshot of every stream, for save states and replay checks"""
+        return {name: stream.getstate() for name, stream in self.streams.items()}
+
+    def set_state(self, state):
+        for name, stream_state in state.items():
+            self.stream(name).setstate(stream_state)
+
+# Shared by all subsystems; Game reseeds it at the start of each run
+rng = RNGService()
+
+def stream(name):
+    """Fetch a named stream from the shared service"""
+    return rng.stream(name)
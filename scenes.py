@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+import pygame
+from enum import Enum
+
+class GameState(Enum):
+    INTRO = 0
+    MENU = 1
+    PLAYING = 2
+    GAME_OVER = 3
+    PAUSED = 4
+    OUTRO = 5
+
+class Scene:
+    """One screen of the game, driven by the single loop in Game.run"""
+    state = None  # GameState this scene stands for
+    overlay = False  # Draw the scene underneath first (e.g. pause over gameplay)
+    dirty_rects = False  # Reports its own changed areas; otherwise every frame is flipped whole
+
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self):
+        """Called when the scene becomes active"""
+        pass
+
+    def exit(self):
+        """Called when the scene is removed from the stack"""
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, frame_time):
+        pass
+
+    def draw(self, surface):
+        pass
+
+class SceneStack:
+    def __init__(self):
+        """Active scenes, bottom to top; only the top one receives input and updates"""
+        self.scenes = []
+
+    @property
+    def top(self):
+        return self.scenes[-1] if self.scenes else None
+
+    def push(self, scene):
+        self.scenes.append(scene)
+        scene.enter()
+
+    def pop(self):
+        scene = self.scenes.pop()
+        scene.exit()
+        return scene
+
+    def replace(self, scene):
+        """Clear the stack and make `scene` the only one"""
+        while self.scenes:
+            self.pop()
+        self.push(scene)
+
+    def draw(self, surface):
+        # Start from the highest scene that covers everything below it
+        start = len(self.scenes) - 1
+        while start > 0 and self.scenes[start].overlay:
+            start -= 1
+        for scene in self.scenes[start:]:
+            scene.draw(surface)
+
+class IntroScene(Scene):
+    state = GameState.INTRO
+
+    def __init__(self, game):
+        super().__init__(game)
+        from intro_sequence import IntroSequence
+        self.intro = IntroSequence(game.screen, game.clock, game.sound_system)
+
+    def handle_event(self, event):
+        player_name = self.intro.handle_event(event)
+        if player_name:
+            self.game.player_name = player_name
+            if self.game.assets_ready:
+                self.game.state = GameState.MENU
+            else:
+                self.intro.start_loading()
+
+    def update(self, frame_time):
+        # Assets load on worker threads while the splash screens play
+        self.game.update_loading()
+        self.intro.set_loading_progress(self.game.loader.progress)
+        if self.intro.update(frame_time):
+            self.game.state = GameState.MENU
+
+    def draw(self, surface):
+        self.intro.draw()
+
+class MenuScene(Scene):
+    state = GameState.MENU
+    dirty_rects = True
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            self.game.on_key_press(event.key)
+
+    def draw(self, surface):
+        self.game.draw_menu()
+
+class PlayingScene(Scene):
+    state = GameState.PLAYING
+    dirty_rects = True
+
+    def enter(self):
+        # Don't try to catch up on time spent in other scenes
+        self.game.accumulator = 0.0
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            self.game.on_key_press(event.key)
+
+    def update(self, frame_time):
+        game = self.game
+        # Run the simulation in fixed steps, carrying the remainder over
+        game.accumulator += frame_time
+        while game.accumulator >= game.sim_step and game.state == self.state:
+            game.delta_time = game.sim_step
+            game.update()
+            game.accumulator -= game.sim_step
+        game.render_alpha = min(1.0, game.accumulator / game.sim_step)
+
+    def draw(self, surface):
+        self.game.draw_playing()
+
+class PauseScene(Scene):
+    state = GameState.PAUSED
+    overlay = True  # The frozen game shows through
+    dirty_rects = True
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            self.game.on_key_press(event.key)
+
+    def draw(self, surface):
+        self.game.draw_pause_screen()
+
+class GameOverScene(Scene):
+    state = GameState.GAME_OVER
+
+    def __init__(self, game):
+        super().__init__(game)
+        from game_over import GameOverScreen
+        # Built once; each death only refreshes its stats
+        self.screen = GameOverScreen(game.screen, game.clock, 0, game.sector_to_str(game.sector), game.player_name)
+
+    def enter(self):
+        game = self.game
+        if game.recorder:
+            game.stop_recording()
+        self.screen.reset(game.player.score, game.sector_to_str(game.sector), game.player_name or "Graduate")
+
+    def handle_event(self, event):
+        result = self.screen.handle_event(event)
+        if result == "restart":
+            self.game.reset_game()
+            self.game.state = GameState.PLAYING
+        elif result == "quit":
+            self.game.quit()
+
+    def draw(self, surface):
+        self.screen.draw()
+
+class OutroScene(Scene):
+    state = GameState.OUTRO
+
+    def __init__(self, game):
+        super().__init__(game)
+        from outro_sequence import OutroSequence
+        self.outro = OutroSequence(game.screen, game.clock)
+
+    def enter(self):
+        self.outro.reset()
+
+    def handle_event(self, event):
+        # Any key skips the outro
+        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            self.game.running = False
+
+    def update(self, frame_time):
+        if self.outro.update(frame_time):
+            self.game.running = False
+
+    def draw(self, surface):
+        self.outro.draw()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+from collections import OrderedDict
+
+# Room for the current sector's layer set and the next one built ahead (~32 MiB each at 1280x720)
+SECTOR_CACHE_BYTES = 64 * 1024 * 1024
+
+def layers_bytes(layers):
+    """Pixel memory held by a set of background layers"""
+    return sum(layer["surface"].get_bytesize() * layer["surface"].get_width() * layer["surface"].get_height()
+               for layer in layers)
+
+class SectorCache:
+    def __init__(self, max_bytes=SECTOR_CACHE_BYTES):
+        """Built background layer sets by sector; the least recently used go once past `max_bytes`"""
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # sector -> (layers, bytes), least recently used first
+        self.bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, sector):
+        return sector in self.entries
+
+    def get(self, sector):
+        """The cached layers for `sector`, or None"""
+        entry = self.entries.get(sector)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(sector)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, sector, layers):
+        """Cache `layers` for `sector`; returns the layer sets evicted to fit it"""
+        if sector in self.entries:
+            self.bytes -= self.entries.pop(sector)[1]
+        size = layers_bytes(layers)
+        self.entries[sector] = (layers, size)
+        self.bytes += size
+        return self.make_room(0)
+
+    def make_room(self, size):
+        """Evict least recently used sets until `size` more bytes fit; returns their layers
+
+        Always keeps the most recently used set, even if it alone is over the limit.
+        """
+        evicted = []
+        while self.bytes + size > self.max_bytes and len(self.entries) > 1:
+            _, (layers, evicted_size) = self.entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+            evicted.append(layers)
+        return evicted
+
+    def stats(self):
+        return {
+            "sectors": list(self.entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
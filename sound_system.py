@@ -4,66 +4,50 @@ import os
 import sys
 from resource_path import resource_path
 
+# Mixer settings, chosen once for the whole game
+AUDIO_SETTINGS = {"frequency": 44100, "size": -16, "channels": 2, "buffer": 2048}
+
+def init_audio():
+    """Open the audio device once with AUDIO_SETTINGS; returns False if there is none.
+
+    Opening the mixer is the probe: no test sound, no waiting.
+    """
+    if pygame.mixer.get_init():
+        return True
+    try:
+        pygame.mixer.init(**AUDIO_SETTINGS)
+    except pygame.error as e:
+        print(f"Warning: Could not initialize audio: {e}")
+        print("Game will run without sound.")
+        return False
+    print(f"Pygame audio driver: {pygame.mixer.get_init()}")
+    return True
+
 class SoundSystem:
-    def __init__(self, audio_available=True):
-        print(f"Pygame version: {pygame.version.ver}")
-        self.audio_available = audio_available
+    def __init__(self, audio_available=True, load_sounds=True):
         self.sfx = {}
         self.bgm = {}
         self.current_music = None
         
-        # Initialize pygame mixer with specific settings
-        try:
-            pygame.mixer.quit()  # First quit any existing mixer
-            pygame.mixer.init(44100, -16, 2, 2048)
-            print(f"Pygame audio driver: {pygame.mixer.get_init()}")
-        except pygame.error as e:
-            print(f"Failed to initialize pygame mixer: {e}")
+        # Caller already knows there is no audio device (e.g. headless runs)
+        if not audio_available:
+            print("Sound system disabled: audio not available")
             self.audio_available = False
             return
-
-        # Test audio initialization with a simple sound
-        test_sound = "button_click.wav"
-        test_path = resource_path(os.path.join("assets", "sounds", test_sound))
-        print(f"Testing sound path: {test_path}")
         
-        try:
-            if os.path.exists(test_path):
-                print(f"Test sound file exists at: {test_path}")
-                test_sound_obj = pygame.mixer.Sound(test_path)
-                test_sound_obj.play()
-                pygame.time.wait(100)  # Wait a bit to ensure sound plays
-                test_sound_obj.stop()
-                print("Audio initialization successful")
-                self.audio_available = True
-            else:
-                print(f"Warning: Test sound file not found at {test_path}")
-                # Try alternative path
-                alt_test_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "sounds", test_sound)
-                if os.path.exists(alt_test_path):
-                    print(f"Found sound at alternative path: {alt_test_path}")
-                    test_sound_obj = pygame.mixer.Sound(alt_test_path)
-                    test_sound_obj.play()
-                    pygame.time.wait(100)
-                    test_sound_obj.stop()
-                    print("Audio initialization successful with alternative path")
-                    self.audio_available = True
-                else:
-                    print("Game will run without sound.")
-                    self.audio_available = False
-                    return
-        except Exception as e:
-            print(f"Warning: Audio initialization failed: {e}")
-            self.audio_available = False
-            return
+        # Reuses the mixer if the launcher already opened it
+        self.audio_available = init_audio()
 
-        if self.audio_available:
+        # Unless the caller decodes them itself (read_sounds, then load_sounds)
+        if self.audio_available and load_sounds:
             self.load_sounds()
             self.play_background_music()
 
-    def load_sounds(self):
+    def read_sounds(self):
+        """Decode the sound effects into a new dict; safe to call off the main thread"""
+        sfx = {}
         if not self.audio_available:
-            return
+            return sfx
             
         try:
             sound_files = {
@@ -92,14 +76,24 @@ class SoundSystem:
                     file_path = resource_path(os.path.join("assets", "sounds", filename))
                     print(f"Loading sound {sound_name} from: {file_path}")
                     if os.path.exists(file_path):
-                        self.sfx[sound_name] = pygame.mixer.Sound(file_path)
-                        self.sfx[sound_name].set_volume(0.2)
+                        sfx[sound_name] = pygame.mixer.Sound(file_path)
+                        sfx[sound_name].set_volume(0.2)
                         print(f"Successfully loaded sound: {sound_name}")
                     else:
                         print(f"Warning: Sound file not found: {file_path}")
                 except Exception as e:
                     print(f"Warning: Could not load sound {sound_name}: {e}")
+        except Exception as e:
+            print(f"Warning: Error in sound system initialization: {e}")
+        return sfx
 
+    def load_sounds(self, sfx=None):
+        """Install decoded sound effects (reading them now if none are given) and find the music"""
+        if not self.audio_available:
+            return
+            
+        self.sfx.update(self.read_sounds() if sfx is None else sfx)
+        try:
             # Background music files
             bgm_path = resource_path(os.path.join("assets", "sounds", "background.wav"))
             print(f"Loading background music from: {bgm_path}")
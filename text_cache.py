@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+from collections import OrderedDict
+
+class TextCache:
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        """LRU cache of rendered text surfaces, bounded by total pixel bytes"""
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()  # key -> (surface, size in bytes)
+        self.total_bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Same as font.render, but reuses the surface for repeated strings.
+
+        The returned surface is shared; callers must not draw onto it.
+        """
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        entry = self.surfaces.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        if size <= self.max_bytes:
+            self.surfaces[key] = (surface, size)
+            self.total_bytes += size
+            self.evict()
+        return surface
+
+    def evict(self):
+        """Drop least recently used surfaces until under the byte budget"""
+        while self.total_bytes > self.max_bytes and self.surfaces:
+            _, (_, size) = self.surfaces.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        self.surfaces.clear()
+        self.total_bytes = 0
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+# Shared by all UI code
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color, background=None):
+    """Render text through the shared cache"""
+    return text_cache.render(font, text, antialias, color, background)
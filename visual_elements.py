@@ -3,8 +3,13 @@ import pygame
 import os
 import random
 import math
+import itertools
+import numpy as np
 import textwrap
 import sys
+import time
+from rng import stream
+from sector_cache import SectorCache
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -16,19 +21,39 @@ def resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+ANIMATION_FOLDERS = {
+    "run": "assets/player/run",
+    "jump": "assets/player/jump",
+    "slide": "assets/player/slide",
+    "idle": "assets/player/idle",
+}
+
+# Tinted sprite variants: colour and blend mode applied over the whole sprite
+TINTS = {
+    "flash": ((255, 255, 255, 128), pygame.BLEND_RGBA_ADD),  # Hit flash
+}
+
 class SpriteManager:
-    def __init__(self):
-        """Initialize sprite manager with placeholder sprites"""
+    def __init__(self, animation_frames=None):
+        """Initialize sprite manager with placeholder sprites
+
+        animation_frames: frames already decoded by read_animations (e.g. on a loader thread)
+        """
         self.sprites = {}
-        self.animations = {
-            "run": self.load_animation("assets/player/run"),
-            "jump": self.load_animation("assets/player/jump"),
-            "slide": self.load_animation("assets/player/slide"),
-            "idle": self.load_animation("assets/player/idle"),
-        }
+        if animation_frames is None:
+            animation_frames = self.read_animations()
+        # Pixel-format conversion needs the display, so it happens here on the main thread
+        self.animations = {state: [frame.convert_alpha() for frame in frames]
+                           for state, frames in animation_frames.items()}
         
         # Create placeholder sprites
         self.create_placeholder_sprites()
+        
+        # Tinted variants are built up front so effects only swap images
+        self.tinted = {}
+        for name in self.sprites:
+            for tint in TINTS:
+                self.get_tinted(name, tint)
         self.flash_timer = 0
         self.shake_timer = 0
         self.shake_offset = (0, 0)
@@ -192,6 +217,17 @@ class SpriteManager:
             error_sprite.fill((255, 0, 255))  # Magenta for missing sprites
             return error_sprite
             
+    def get_tinted(self, name, tint):
+        """Cached copy of a sprite with one of TINTS applied"""
+        key = (name, tint)
+        image = self.tinted.get(key)
+        if image is None:
+            color, blend = TINTS[tint]
+            image = self.get_sprite(name).copy()
+            image.fill(color, special_flags=blend)
+            self.tinted[key] = image
+        return image
+            
     def get_animation_frame(self, name, frame_index):
         """Get a specific frame from an animation"""
         if name in self.animations:
@@ -202,14 +238,20 @@ class SpriteManager:
         # Return default sprite if animation not found
         return self.get_sprite("player")
 
-    def load_animation(self, folder):
+    @staticmethod
+    def read_animations():
+        """Decode every player animation; safe to call off the main thread"""
+        return {state: SpriteManager.read_animation(folder) for state, folder in ANIMATION_FOLDERS.items()}
+
+    @staticmethod
+    def read_animation(folder):
         frames = []
         try:
             folder_path = resource_path(folder)
             for filename in sorted(os.listdir(folder_path)):
                 if filename.endswith(".png"):
                     frame_path = os.path.join(folder_path, filename)
-                    frames.append(pygame.image.load(frame_path).convert_alpha())
+                    frames.append(pygame.image.load(frame_path))
         except Exception as e:
             print(f"Error loading animation from {folder}: {e}")
             # Return a default animation frame if loading fails
@@ -218,60 +260,158 @@ class SpriteManager:
             frames = [default_frame]
         return frames
 
+    def load_animation(self, folder):
+        return [frame.convert_alpha() for frame in self.read_animation(folder)]
+
     def get_animation(self, state):
         return self.animations[state]
 
+# Sectors in play order; after the last the run wraps around to the first
+SECTOR_CYCLE = ("SILICON_VALLEY", "TECH", "ACADEMIA", "CREATIVE", "RETAIL")
+NEXT_SECTOR = dict(zip(SECTOR_CYCLE, SECTOR_CYCLE[1:] + SECTOR_CYCLE[:1]))
+
+# Sector-specific companies on building billboards
+SECTOR_COMPANIES = {
+    "SILICON_VALLEY": [
+        {"name": "Google", "logo": "google"},
+        {"name": "Apple", "logo": "apple"},
+        {"name": "Meta", "logo": "meta"},
+        {"name": "Netflix", "logo": "netflix"},
+        {"name": "StartupX", "logo": "startupx"},
+        {"name": "ChatGPT", "logo": "chatgpt"},
+    ],
+    "TECH": [
+        {"name": "Amazon", "logo": "amazon"},
+        {"name": "Microsoft", "logo": "microsoft"},
+        {"name": "IBM", "logo": "ibm"},
+        {"name": "Oracle", "logo": "oracle"},
+    ],
+    "ACADEMIA": [
+        {"name": "Harvard", "logo": "harvard"},
+        {"name": "MIT", "logo": "mit"},
+        {"name": "Stanford", "logo": "stanford"},
+        {"name": "Library", "logo": "library"},
+    ],
+    "CREATIVE": [
+        {"name": "ArtStudio", "logo": "artstudio"},
+        {"name": "Theater", "logo": "theater"},
+        {"name": "Gallery", "logo": "gallery"},
+    ],
+    "RETAIL": [
+        {"name": "Mall", "logo": "mall"},
+        {"name": "ShopEZ", "logo": "shopez"},
+        {"name": "SuperMart", "logo": "supermart"},
+    ]
+}
+
+def layer_sizes(width, height):
+    """Surface sizes in one background layer set: the sky, then four double-width scrolling layers"""
+    return [(width, height)] + [(width * 2, height)] * 4
+
+def run_steps(steps):
+    """Run a step-by-step build generator to the end and return what it built"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
 class ParallaxBackground:
-    def __init__(self, screen_width, screen_height, sector):
+    def __init__(self, screen_width, screen_height, sector, cache=None, prefetch=True, logo_images=None,
+                 spare_surfaces=(), build=True):
+        """Scrolling sector layers, cached per sector, with the next sector built ahead
+
+        `prefetch` builds the next sector a few steps per frame via build_ahead. logo_images and
+        spare_surfaces: logos and layer surfaces from read_assets (e.g. on a loader thread). Fonts
+        and pixel-format conversion need the main thread, so construct it there. With build=False
+        nothing is shown until load_steps has built `sector`.
+        """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.random = stream("background")
         self.layers = []
         self.billboard_offset = 0
         self.window_flicker_state = {}
         self.drone_positions = []
-        self.create_placeholder_layers(sector)
+        self.label_font = pygame.font.Font(None, 18)  # Billboard company names
+        # Billboard logos, scaled once up front so building a layer never decodes images
+        if logo_images is None:
+            logo_images = self.read_logos()
+        self.logos = {name: self.load_logo(name, image) for name, image in logo_images.items()}
+        self.cache = cache or SectorCache()
+        self.prefetch = prefetch
+        self.prefetching = None  # (sector, step generator) of the set being built ahead
+        self.longest_step = 0.0  # Longest step of the current build ahead (s), to judge whether another fits
+        self.spare_surfaces = list(spare_surfaces)  # Allocated up front or from dropped layer sets
+        if build:
+            self.set_sector(sector)
         
-    def load_logo(self, name):
-        path = resource_path(os.path.join("assets", "logos", f"{name}.png"))
-        if os.path.exists(path):
-            return pygame.image.load(path).convert_alpha()
+    @staticmethod
+    def read_assets(screen_width, screen_height):
+        """Decode the logos and allocate two layer sets' surfaces (the first sector and the one built
+        ahead); safe to call off the main thread"""
+        sizes = layer_sizes(screen_width, screen_height) * 2
+        return ParallaxBackground.read_logos(), [pygame.Surface(size, pygame.SRCALPHA) for size in sizes]
+
+    @staticmethod
+    def read_logos():
+        """Decode every billboard logo at its 40x40 billboard size (None where the file is missing);
+        safe to call off the main thread"""
+        logos = {}
+        for companies in SECTOR_COMPANIES.values():
+            for company in companies:
+                path = resource_path(os.path.join("assets", "logos", f"{company['logo']}.png"))
+                if os.path.exists(path):
+                    logos[company["logo"]] = pygame.transform.smoothscale(pygame.image.load(path), (40, 40))
+                else:
+                    logos[company["logo"]] = None
+        return logos
+
+    def load_logo(self, name, image):
+        if image is not None:
+            return image.convert_alpha()
         else:
             surf = pygame.Surface((40, 40), pygame.SRCALPHA)
             pygame.draw.rect(surf, (200, 200, 200), (0, 0, 40, 40))
-            font = pygame.font.Font(None, 18)
-            text = font.render(name[0].upper(), True, (0, 0, 0))
+            text = self.label_font.render(name[0].upper(), True, (0, 0, 0))
             surf.blit(text, (10, 10))
             return surf
 
     def create_skyline_layer(self, sector_key):
-        layer = pygame.Surface((self.screen_width * 2, self.screen_height), pygame.SRCALPHA)
+        return run_steps(self.skyline_layer_steps(sector_key))
+
+    def skyline_layer_steps(self, sector_key):
+        layer = yield from self.layer_surface_steps((self.screen_width * 2, self.screen_height))
         if sector_key == "SILICON_VALLEY":
             color = (120, 220, 200)
             for x in range(0, self.screen_width * 2, 180):
-                height = random.randint(100, 180)
+                height = self.random.randint(100, 180)
                 pygame.draw.rect(layer, color, (x, self.screen_height - height, 140, height), border_radius=18)
                 # Solar panels
                 pygame.draw.rect(layer, (80, 120, 120), (x+20, self.screen_height - height + 20, 40, 10))
+                yield
         elif sector_key == "TECH":
             color = (60, 60, 100)
             for x in range(0, self.screen_width * 2, 140):
-                height = random.randint(120, 200)
+                height = self.random.randint(120, 200)
                 pygame.draw.rect(layer, color, (x, self.screen_height - height, 100, height), border_radius=8)
                 # Server lights
                 for i in range(5):
                     pygame.draw.circle(layer, (0, 255, 0), (x+20+i*15, self.screen_height - height + 20), 3)
+                yield
         elif sector_key == "ACADEMIA":
             color = (180, 180, 140)
             for x in range(0, self.screen_width * 2, 200):
-                height = random.randint(130, 180)
+                height = self.random.randint(130, 180)
                 pygame.draw.rect(layer, color, (x, self.screen_height - height, 120, height), border_radius=12)
                 # Clock tower
                 pygame.draw.rect(layer, (120, 120, 100), (x+40, self.screen_height - height - 40, 40, 40))
                 pygame.draw.circle(layer, (255, 255, 255), (x+60, self.screen_height - height - 20), 12)
+                yield
         elif sector_key == "CREATIVE":
             for x in range(0, self.screen_width * 2, 160):
-                height = random.randint(100, 180)
-                color = (random.randint(180, 255), random.randint(100, 200), random.randint(180, 255))
+                height = self.random.randint(100, 180)
+                color = (self.random.randint(180, 255), self.random.randint(100, 200), self.random.randint(180, 255))
                 pygame.draw.rect(layer, color, (x, self.screen_height - height, 120, height), border_radius=20)
                 # Spotlights
                 pygame.draw.polygon(layer, (255, 255, 180, 80), [
@@ -279,109 +419,85 @@ class ParallaxBackground:
                     (x+40, self.screen_height),
                     (x+80, self.screen_height)
                 ])
+                yield
         elif sector_key == "RETAIL":
             color = (200, 200, 200)
             for x in range(0, self.screen_width * 2, 180):
-                height = random.randint(100, 160)
+                height = self.random.randint(100, 160)
                 pygame.draw.rect(layer, color, (x, self.screen_height - height, 140, height), border_radius=10)
                 # Sale sign
                 pygame.draw.rect(layer, (255, 0, 0), (x+30, self.screen_height - height + 30, 40, 20))
-                font = pygame.font.Font(None, 18)
-                text = font.render("SALE", True, (255, 255, 255))
+                text = self.label_font.render("SALE", True, (255, 255, 255))
                 layer.blit(text, (x+35, self.screen_height - height + 32))
+                yield
         else:
             color = (50, 50, 70)
             for x in range(0, self.screen_width * 2, 120):
-                height = random.randint(120, 220)
+                height = self.random.randint(120, 220)
                 pygame.draw.rect(layer, color, (x, self.screen_height - height, 100, height))
+                yield
         return {"surface": layer, "speed": 0.08, "offset": 0}
 
     def create_cloud_layer(self, sector_key):
-        layer = pygame.Surface((self.screen_width * 2, self.screen_height), pygame.SRCALPHA)
+        return run_steps(self.cloud_layer_steps(sector_key))
+
+    def cloud_layer_steps(self, sector_key):
+        layer = yield from self.layer_surface_steps((self.screen_width * 2, self.screen_height))
         if sector_key == "SILICON_VALLEY":
             # Silicon Valley clouds
             for _ in range(8):
-                x = random.randint(0, self.screen_width * 2)
-                y = random.randint(30, 250)
-                size = random.randint(100, 200)
+                x = self.random.randint(0, self.screen_width * 2)
+                y = self.random.randint(30, 250)
+                size = self.random.randint(100, 200)
                 cloud = pygame.Surface((size, size // 2), pygame.SRCALPHA)
                 for i in range(3):
                     pygame.draw.ellipse(cloud, (220, 220, 220, 120), (i*size//8, i*size//12, size//2, size//3))
                 layer.blit(cloud, (x, y))
+                yield
         else:
             # Other sectors' clouds
             for _ in range(12):
-                x = random.randint(0, self.screen_width * 2)
-                y = random.randint(30, 250)
-                size = random.randint(80, 180)
+                x = self.random.randint(0, self.screen_width * 2)
+                y = self.random.randint(30, 250)
+                size = self.random.randint(80, 180)
                 cloud = pygame.Surface((size, size // 2), pygame.SRCALPHA)
                 for i in range(3):
                     pygame.draw.ellipse(cloud, (220, 220, 220, 120), (i*size//8, i*size//12, size//2, size//3))
                 layer.blit(cloud, (x, y))
+                yield
         return {"surface": layer, "speed": 0.15, "offset": 0}
 
     def create_building_layer(self, sector):
-        layer = pygame.Surface((self.screen_width * 2, self.screen_height), pygame.SRCALPHA)
+        return run_steps(self.building_layer_steps(sector))
+
+    def building_layer_steps(self, sector):
+        """Generator: one step per building column; returns the layer"""
+        layer = yield from self.layer_surface_steps((self.screen_width * 2, self.screen_height))
         y_base = self.screen_height
 
         # Randomized buildings
         building_colors = [(70, 70, 90), (100, 100, 120), (120, 120, 140)]
         num_buildings = self.screen_width * 2 // 80
-        company_buildings = random.sample(range(num_buildings), min(4, num_buildings))
-
-        # Sector-specific companies
-        companies = {
-            "SILICON_VALLEY": [
-                {"name": "Google", "logo": "google"},
-                {"name": "Apple", "logo": "apple"},
-                {"name": "Meta", "logo": "meta"},
-                {"name": "Netflix", "logo": "netflix"},
-                {"name": "StartupX", "logo": "startupx"},
-                {"name": "ChatGPT", "logo": "chatgpt"},
-            ],
-            "TECH": [
-                {"name": "Amazon", "logo": "amazon"},
-                {"name": "Microsoft", "logo": "microsoft"},
-                {"name": "IBM", "logo": "ibm"},
-                {"name": "Oracle", "logo": "oracle"},
-            ],
-            "ACADEMIA": [
-                {"name": "Harvard", "logo": "harvard"},
-                {"name": "MIT", "logo": "mit"},
-                {"name": "Stanford", "logo": "stanford"},
-                {"name": "Library", "logo": "library"},
-            ],
-            "CREATIVE": [
-                {"name": "ArtStudio", "logo": "artstudio"},
-                {"name": "Theater", "logo": "theater"},
-                {"name": "Gallery", "logo": "gallery"},
-            ],
-            "RETAIL": [
-                {"name": "Mall", "logo": "mall"},
-                {"name": "ShopEZ", "logo": "shopez"},
-                {"name": "SuperMart", "logo": "supermart"},
-            ]
-        }
+        company_buildings = self.random.sample(range(num_buildings), min(4, num_buildings))
+
         sector_key = str(sector).upper()
-        sector_companies = companies.get(sector_key, [])
+        sector_companies = SECTOR_COMPANIES.get(sector_key, [])
         company_idx = 0
 
         for i in range(num_buildings):
-            x = i * 80 + random.randint(-10, 10)
-            width = random.randint(60, 90)
-            height = random.randint(180, 320)
-            color = random.choice(building_colors)
+            x = i * 80 + self.random.randint(-10, 10)
+            width = self.random.randint(60, 90)
+            height = self.random.randint(180, 320)
+            color = self.random.choice(building_colors)
             pygame.draw.rect(layer, color, (x, y_base - height, width, height), border_radius=8)
 
             # Place a company billboard on a few buildings
             if i in company_buildings and company_idx < len(sector_companies):
-                logo = self.load_logo(sector_companies[company_idx]["logo"])
-                logo = pygame.transform.smoothscale(logo, (40, 40))
+                logo = self.logos[sector_companies[company_idx]["logo"]]
                 billboard_rect = pygame.Rect(x + width // 2 - 20, y_base - height - 50, 40, 40)
                 pygame.draw.rect(layer, (30, 30, 30), billboard_rect, border_radius=6)
                 layer.blit(logo, billboard_rect.topleft)
-                font = pygame.font.Font(None, 18)
-                text = font.render(sector_companies[company_idx]["name"], True, (255, 255, 255))
+                text = self.label_font.render(sector_companies[company_idx]["name"], True, (255, 255, 255))
                 layer.blit(text, (billboard_rect.centerx - text.get_width() // 2, billboard_rect.bottom + 2))
                 company_idx += 1
 
@@ -390,16 +506,17 @@ class ParallaxBackground:
                 for wy in range(40, height - 20, 30):
                     win_key = (x + wx, y_base - wy)
                     if win_key not in self.window_flicker_state:
-                        self.window_flicker_state[win_key] = random.choice([True, False])
+                        self.window_flicker_state[win_key] = self.random.choice([True, False])
                     color = (255, 255, 180) if self.window_flicker_state[win_key] else (40, 40, 40)
                     pygame.draw.rect(layer, color, (x + wx, y_base - wy, 12, 18))
+            yield
 
         # Animated drones (on top of all buildings)
         num_drones = 3
         if not self.drone_positions or len(self.drone_positions) != num_drones:
-            self.drone_positions = [random.randint(0, self.screen_width * 2) for _ in range(num_drones)]
-        drone_y = [random.randint(80, 200) for _ in range(num_drones)]
-        drone_speed = [random.uniform(40, 80) for _ in range(num_drones)]
+            self.drone_positions = [self.random.randint(0, self.screen_width * 2) for _ in range(num_drones)]
+        drone_y = [self.random.randint(80, 200) for _ in range(num_drones)]
+        drone_speed = [self.random.uniform(40, 80) for _ in range(num_drones)]
         drone_color = (180, 220, 255)
         drone_radius = 12
         for i in range(num_drones):
@@ -412,48 +529,171 @@ class ParallaxBackground:
         return {"surface": layer, "speed": 0.3, "offset": 0}
 
     def create_foreground_layer(self, sector_key):
-        layer = pygame.Surface((self.screen_width * 2, self.screen_height), pygame.SRCALPHA)
+        return run_steps(self.foreground_layer_steps(sector_key))
+
+    def foreground_layer_steps(self, sector_key):
+        """Generator: one step per foreground element; returns the layer"""
+        layer = yield from self.layer_surface_steps((self.screen_width * 2, self.screen_height))
         if sector_key == "SILICON_VALLEY":
             # Drones flying in foreground
             for i in range(2):
-                x = random.randint(0, self.screen_width * 2)
-                y = random.randint(self.screen_height-220, self.screen_height-180)
+                x = self.random.randint(0, self.screen_width * 2)
+                y = self.random.randint(self.screen_height-220, self.screen_height-180)
                 pygame.draw.circle(layer, (180, 220, 255), (x, y), 18)
+                yield
         elif sector_key == "TECH":
             # Rolling robots
             for i in range(2):
-                x = random.randint(0, self.screen_width * 2)
+                x = self.random.randint(0, self.screen_width * 2)
                 y = self.screen_height - 60
                 pygame.draw.rect(layer, (100, 100, 120), (x, y, 40, 30), border_radius=8)
                 pygame.draw.circle(layer, (0, 255, 0), (x+10, y+30), 8)
                 pygame.draw.circle(layer, (0, 255, 0), (x+30, y+30), 8)
+                yield
         elif sector_key == "ACADEMIA":
             # Books and caps
             for i in range(3):
-                x = random.randint(0, self.screen_width * 2)
-                y = self.screen_height - random.randint(80, 120)
+                x = self.random.randint(0, self.screen_width * 2)
+                y = self.screen_height - self.random.randint(80, 120)
                 pygame.draw.rect(layer, (200, 180, 140), (x, y, 30, 10))
                 pygame.draw.polygon(layer, (0, 0, 0), [(x, y), (x+30, y), (x+15, y-10)])
+                yield
         elif sector_key == "CREATIVE":
             # Paint splashes
             for i in range(5):
-                x = random.randint(0, self.screen_width * 2)
-                y = self.screen_height - random.randint(60, 100)
-                color = (random.randint(180, 255), random.randint(100, 255), random.randint(180, 255), 180)
+                x = self.random.randint(0, self.screen_width * 2)
+                y = self.screen_height - self.random.randint(60, 100)
+                color = (self.random.randint(180, 255), self.random.randint(100, 255), self.random.randint(180, 255), 180)
                 pygame.draw.ellipse(layer, color, (x, y, 30, 18))
+                yield
         elif sector_key == "RETAIL":
             # Shopping carts
             for i in range(2):
-                x = random.randint(0, self.screen_width * 2)
+                x = self.random.randint(0, self.screen_width * 2)
                 y = self.screen_height - 50
                 pygame.draw.rect(layer, (180, 180, 180), (x, y, 40, 20), border_radius=6)
                 pygame.draw.circle(layer, (80, 80, 80), (x+10, y+20), 6)
                 pygame.draw.circle(layer, (80, 80, 80), (x+30, y+20), 6)
+                yield
         return {"surface": layer, "speed": 0.35, "offset": 0}
 
-    def create_placeholder_layers(self, sector):
-        self.layers = []
+    def layer_sizes(self):
+        return layer_sizes(self.screen_width, self.screen_height)
+
+    def layer_surface_steps(self, size):
+        """Generator: a clear SRCALPHA surface of `size`, reusing a spare one if there is one"""
+        for i, surface in enumerate(self.spare_surfaces):
+            if surface.get_size() == size:
+                del self.spare_surfaces[i]
+                # A strip per step; clearing is still far cheaper than allocating
+                for y in range(0, size[1], 180):
+                    surface.fill((0, 0, 0, 0), (0, y, size[0], 180))
+                    yield
+                return surface
+        return pygame.Surface(size, pygame.SRCALPHA)
+
+    def recycle(self, layer_sets):
+        """Keep dropped layer sets' surfaces as spares, at most one set's worth"""
+        wanted = self.layer_sizes()
+        spares = []
+        dropped = [layer["surface"] for layers in layer_sets if layers is not self.layers for layer in layers]
+        for surface in self.spare_surfaces + dropped:
+            if surface.get_size() in wanted:
+                wanted.remove(surface.get_size())
+                spares.append(surface)
+        self.spare_surfaces = spares
+
+    def missing_surfaces(self):
+        """Sizes the next build would still have to allocate after using up the spares"""
+        missing = self.layer_sizes()
+        for surface in self.spare_surfaces:
+            if surface.get_size() in missing:
+                missing.remove(surface.get_size())
+        return missing
+
+    def reserve_surfaces(self):
+        """Have a layer set's surfaces ready before building ahead, so no budgeted step allocates
+
+        Makes room in the cache by recycling its least recently used sets; whatever is still
+        missing is allocated here.
+        """
+        self.recycle(self.cache.make_room(sum(4 * width * height for width, height in self.missing_surfaces())))
+        self.spare_surfaces.extend(pygame.Surface(size, pygame.SRCALPHA) for size in self.missing_surfaces())
+
+    def set_sector(self, sector):
+        """Show `sector`'s layers, from the cache when they were built before"""
         sector_key = str(sector).upper()
+        # Only one build at a time: they share the random stream, which keeps its order
+        self.finish_prefetch()
+        layers = self.cache.get(sector_key)
+        if layers is None:
+            layers = self.build_layers(sector_key)
+            self.recycle(self.cache.put(sector_key, layers))
+        for layer in layers:
+            layer["offset"] = 0
+            layer.pop("prev_offset", None)
+        self.layers = layers
+
+        next_sector = NEXT_SECTOR.get(sector_key)
+        if not next_sector or next_sector in self.cache:
+            return
+        if self.prefetch:
+            # Surfaces come ready now, outside build_ahead's per-frame slice
+            self.reserve_surfaces()
+            self.prefetching = (next_sector, self.layer_steps(next_sector))
+            self.longest_step = 0.0
+
+    def load_steps(self, sector):
+        """Generator: build `sector`'s layers a step at a time, then show them; returns the background
+
+        The first set_sector, spread over frames (e.g. by the asset loader during the intro).
+        """
+        sector_key = str(sector).upper()
+        layers = yield from self.layer_steps(sector_key)
+        self.recycle(self.cache.put(sector_key, layers))
+        self.set_sector(sector_key)  # Cached now; starts building the next sector ahead
+        return self
+
+    def build_ahead(self, budget_ms):
+        """Run incremental prefetch steps for up to about `budget_ms`; call once per frame.
+
+        Returns True while there is still work left.
+        """
+        if not self.prefetching:
+            return False
+        sector_key, steps = self.prefetching
+        deadline = time.perf_counter() + budget_ms / 1000
+        # Always make progress; after that, only take a step if one as long as the longest yet still fits
+        while True:
+            start = time.perf_counter()
+            try:
+                step = next(steps)
+            except StopIteration as done:
+                self.prefetching = None
+                self.recycle(self.cache.put(sector_key, done.value))
+                return False
+            now = time.perf_counter()
+            self.longest_step = max(self.longest_step, now - start)
+            if now + self.longest_step > deadline:
+                return True
+
+    def finish_prefetch(self):
+        """Cache the set being built ahead, finishing it now if it isn't done"""
+        if self.prefetching:
+            sector_key, steps = self.prefetching
+            self.prefetching = None
+            self.recycle(self.cache.put(sector_key, run_steps(steps)))
+
+    def create_placeholder_layers(self, sector):
+        """Rebuild the current layers from scratch (bypasses the cache)"""
+        self.layers = self.build_layers(str(sector).upper())
+
+    def build_layers(self, sector_key):
+        return run_steps(self.layer_steps(sector_key))
+
+    def layer_steps(self, sector_key):
+        """Generator building a sector's layer set in small steps (a few ms at most); returns the layers"""
+        layers = []
 
         # 1. Sky (sector-specific gradient)
         sky_gradients = {
@@ -464,32 +704,35 @@ class ParallaxBackground:
             "RETAIL": [(255, 255, 255), (255, 220, 180)],
         }
         top_color, bottom_color = sky_gradients.get(sector_key, [(30, 40, 80), (120, 180, 255)])
-        layer0 = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        layer0 = yield from self.layer_surface_steps((self.screen_width, self.screen_height))
         for y in range(self.screen_height):
             r = int(top_color[0] + (bottom_color[0] - top_color[0]) * (y / self.screen_height))
             g = int(top_color[1] + (bottom_color[1] - top_color[1]) * (y / self.screen_height))
             b = int(top_color[2] + (bottom_color[2] - top_color[2]) * (y / self.screen_height))
             pygame.draw.line(layer0, (r, g, b), (0, y), (self.screen_width, y))
-        self.layers.append({"surface": layer0, "speed": 0.0, "offset": 0})
+            if y % 30 == 29:
+                yield
+        layers.append({"surface": layer0, "speed": 0.0, "offset": 0})
 
         # 2. Skyline (sector-specific)
-        self.layers.append(self.create_skyline_layer(sector_key))
+        layers.append((yield from self.skyline_layer_steps(sector_key)))
 
         # 3. Clouds (sector-specific)
-        self.layers.append(self.create_cloud_layer(sector_key))
+        layers.append((yield from self.cloud_layer_steps(sector_key)))
 
         # 4. Buildings (sector-specific)
-        self.layers.append(self.create_building_layer(sector_key))
+        layers.append((yield from self.building_layer_steps(sector_key)))
 
         # 5. Foreground (optional, sector-specific)
-        self.layers.append(self.create_foreground_layer(sector_key))
+        layers.append((yield from self.foreground_layer_steps(sector_key)))
+        return layers
         
     def update(self, delta_time, speed):
         for layer in self.layers:
             layer["offset"] = (layer["offset"] + speed * layer["speed"] * delta_time) % layer["surface"].get_width()
         self.billboard_offset = (self.billboard_offset + int(120 * delta_time)) % 400
         for key in self.window_flicker_state:
-            if random.random() < 0.02:
+            if self.random.random() < 0.02:
                 self.window_flicker_state[key] = not self.window_flicker_state[key]
             
     def draw(self, surface):
@@ -506,120 +749,322 @@ class ParallaxBackground:
             elif layer["speed"] == 0.3:
                 self.layers[i] = self.create_building_layer(sector)
 
+# Particle kinds; the per-kind tables below are indexed by these codes
+PARTICLE_TYPES = ("stress", "money", "diploma", "anxiety")
+STRESS, MONEY, DIPLOMA, ANXIETY = range(len(PARTICLE_TYPES))
+PARTICLE_GRAVITY = np.array([0.0, 200.0, 200.0, 0.0])  # Downward pull per kind, px/s²
+# Who keeps spawning under load: power-up rewards, then hit feedback, then ambient sparks
+PARTICLE_PRIORITY = np.array([2, 3, 3, 1])
+TOP_PRIORITY = int(PARTICLE_PRIORITY.max())
+PARTICLE_CENTERED = np.array([True, False, False, True])  # Circles are drawn around their position
+
+# Sizes and colors each kind spawns with, baked into the atlas up front
+DIPLOMA_SHADES = (100, 178, 255)  # Confetti colors are snapped to these per channel
+PARTICLE_STYLES = (
+    (STRESS, range(3, 9), [(255, 0, 0)]),
+    (MONEY, range(5, 11), [(0, 200, 0)]),
+    (DIPLOMA, range(5, 13), list(itertools.product(DIPLOMA_SHADES, repeat=3))),
+    (ANXIETY, range(2, 6), [(255, 255, 0)]),
+)
+
+class ParticleAtlas:
+    ALPHA_LEVELS = 16  # Pre-faded copies of each particle image
+
+    def __init__(self, styles=PARTICLE_STYLES):
+        """Every particle image rendered once per fade level, so drawing is blits only
+
+        Images are addressed by slot: one per (kind, size, color), with its fade levels at
+        frames[slot * ALPHA_LEVELS + level].
+        """
+        self.frames = []
+        self.slots = {}
+        self.fonts = {}  # "$" font per money size
+        for kind, sizes, colors in styles:
+            for size in sizes:
+                for color in colors:
+                    self.slot(kind, size, color)
+
+    def slot(self, kind, size, color):
+        """Atlas slot for a particle look; bakes it on first use if it wasn't preloaded"""
+        if kind == DIPLOMA:
+            color = tuple(min(DIPLOMA_SHADES, key=lambda shade: abs(shade - channel)) for channel in color)
+        key = (kind, size, color)
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = len(self.frames) // self.ALPHA_LEVELS
+            self.frames.extend(self.render(kind, size, color, self.alpha(level))
+                               for level in range(self.ALPHA_LEVELS))
+        return slot
+
+    def alpha(self, level):
+        return 255 * (level + 1) // self.ALPHA_LEVELS
+
+    def render(self, kind, size, color, alpha):
+        if kind == MONEY:
+            # Dollar sign
+            font = self.fonts.get(size)
+            if font is None:
+                font = self.fonts[size] = pygame.font.Font(None, size * 2)
+            image = font.render("$", True, color)
+            image.set_alpha(alpha)
+        elif kind == DIPLOMA:
+            # Small rectangle
+            image = pygame.Surface((size, size * 1.5))
+            image.fill(color)
+            image.set_alpha(alpha)
+        else:
+            # Circle
+            image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(image, color + (alpha,), (size, size), size)
+        return image
+
 class ParticleSystem:
-    def __init__(self):
-        """Initialize particle system"""
-        self.particles = []
-        
+    # Parallel per-particle arrays
+    FIELDS = ("x", "y", "vx", "vy", "life", "size", "color", "kind", "slot")
+
+    # Load shedding
+    MIN_SPAWN_SCALE = 0.25
+    TINY = 3  # Particles this size or smaller may be merged under load
+    MERGE_CELL = 8  # Tiny particles with the same look in one cell this many px wide merge into one
+
+    def __init__(self, capacity=1024, atlas=None, budget=3000, screen_size=(1280, 720), frame_budget_ms=1000 / 60):
+        """Live particles as parallel NumPy arrays, moved, aged and culled in bulk
+
+        Slots [0, count) are live and kept packed; the arrays grow when a burst doesn't fit.
+        At most `budget` particles live at once, and frames over `frame_budget_ms` make the
+        system shed load (see shed_load).
+        """
+        self.random = stream("particles")
+        self.atlas = atlas or ParticleAtlas()
+        self.count = 0
+        self.capacity = 0
+        self.allocate(min(capacity, budget))
+        self.budget = budget
+        self.screen_size = screen_size
+        self.frame_budget_ms = frame_budget_ms
+        self.spawn_scale = 1.0  # Fraction of each burst spawned; lowered while frames run long
+
+        # Stats
+        self.high_water = 0
+        self.dropped = 0  # Spawns refused: thinned under load or past the budget
+        self.culled = 0  # Live particles removed early: evicted for higher priorities or off screen
+        self.merged = 0
+
+    def __len__(self):
+        return self.count
+
+    def allocate(self, capacity):
+        """Resize the arrays to `capacity` slots, keeping the live particles"""
+        arrays = {
+            "x": np.zeros(capacity),
+            "y": np.zeros(capacity),
+            "vx": np.zeros(capacity),
+            "vy": np.zeros(capacity),
+            "life": np.zeros(capacity),  # Seconds left; also drives the fade
+            "size": np.zeros(capacity, dtype=np.int64),
+            "color": np.zeros((capacity, 3), dtype=np.uint8),
+            "kind": np.zeros(capacity, dtype=np.int8),  # Index into PARTICLE_TYPES
+            "slot": np.zeros(capacity, dtype=np.int64),  # Image in the atlas
+        }
+        n = self.count
+        for name, array in arrays.items():
+            if n:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def emit(self, kind, spawned):
+        """Append particles of one kind from (x, y, vx, vy, size, color, life) tuples, within the budget"""
+        priority = PARTICLE_PRIORITY[kind]
+        if self.spawn_scale < 1.0:
+            # Thin bursts under load; the lower the priority the harder
+            keep = math.ceil(len(spawned) * self.spawn_scale ** (TOP_PRIORITY - priority))
+            self.dropped += len(spawned) - keep
+            spawned = spawned[:keep]
+        room = self.budget - self.count
+        if len(spawned) > room:
+            room += self.evict(len(spawned) - room, priority)
+            if len(spawned) > room:
+                self.dropped += len(spawned) - room
+                spawned = spawned[:room]
+        if not spawned:
+            return
+        n = self.count
+        end = n + len(spawned)
+        if end > self.capacity:
+            self.allocate(max(end, self.capacity * 2))
+        x, y, vx, vy, size, color, life = zip(*spawned)
+        self.x[n:end] = x
+        self.y[n:end] = y
+        self.vx[n:end] = vx
+        self.vy[n:end] = vy
+        self.size[n:end] = size
+        self.color[n:end] = color
+        self.life[n:end] = life
+        self.kind[n:end] = kind
+        self.slot[n:end] = [self.atlas.slot(kind, s, c) for s, c in zip(size, color)]
+        self.count = end
+        if end > self.high_water:
+            self.high_water = end
+
+    def evict(self, needed, priority):
+        """Free up to `needed` slots from particles of lower priority, lowest and oldest first"""
+        n = self.count
+        priorities = PARTICLE_PRIORITY[self.kind[:n]]
+        lower = np.flatnonzero(priorities < priority)
+        if not len(lower):
+            return 0
+        victims = lower[np.argsort(priorities[lower], kind="stable")[:needed]]
+        mask = np.zeros(n, dtype=bool)
+        mask[victims] = True
+        self.remove(mask)
+        self.culled += len(victims)
+        return len(victims)
+
+    # Spawners draw their random numbers in the same per-particle order as always,
+    # so the "particles" stream stays reproducible for seeded runs
     def add_stress_particles(self, x, y, count=10):
         """Add stress particles at position"""
-        for _ in range(count):
-            particle = {
-                "x": x + random.randint(-20, 20),
-                "y": y + random.randint(-20, 20),
-                "vx": random.uniform(-50, 50),
-                "vy": random.uniform(-100, -50),
-                "size": random.randint(3, 8),
-                "color": (255, 0, 0),
-                "life": random.uniform(0.5, 1.5),
-                "type": "stress"
-            }
-            self.particles.append(particle)
+        rand = self.random
+        self.emit(STRESS, [(x + rand.randint(-20, 20), y + rand.randint(-20, 20),
+                            rand.uniform(-50, 50), rand.uniform(-100, -50),
+                            rand.randint(3, 8), (255, 0, 0), rand.uniform(0.5, 1.5))
+                           for _ in range(count)])
             
     def add_money_particles(self, x, y, count=15):
         """Add money particles at position"""
-        for _ in range(count):
-            particle = {
-                "x": x + random.randint(-20, 20),
-                "y": y + random.randint(-20, 20),
-                "vx": random.uniform(-80, 80),
-                "vy": random.uniform(-150, -50),
-                "size": random.randint(5, 10),
-                "color": (0, 200, 0),
-                "life": random.uniform(0.3, 0.8),  # Short life for money
-                "type": "money"
-            }
-            self.particles.append(particle)
+        rand = self.random
+        self.emit(MONEY, [(x + rand.randint(-20, 20), y + rand.randint(-20, 20),
+                           rand.uniform(-80, 80), rand.uniform(-150, -50),
+                           rand.randint(5, 10), (0, 200, 0), rand.uniform(0.3, 0.8))  # Short life for money
+                          for _ in range(count)])
             
     def add_diploma_particles(self, x, y, count=20):
         """Add diploma confetti particles"""
-        for _ in range(count):
-            particle = {
-                "x": x + random.randint(-30, 30),
-                "y": y + random.randint(-30, 30),
-                "vx": random.uniform(-100, 100),
-                "vy": random.uniform(-200, -100),
-                "size": random.randint(5, 12),
-                "color": (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255)),
-                "life": random.uniform(1.0, 3.0),
-                "type": "diploma"
-            }
-            self.particles.append(particle)
+        rand = self.random
+        self.emit(DIPLOMA, [(x + rand.randint(-30, 30), y + rand.randint(-30, 30),
+                             rand.uniform(-100, 100), rand.uniform(-200, -100),
+                             rand.randint(5, 12), (rand.randint(100, 255), rand.randint(100, 255), rand.randint(100, 255)),
+                             rand.uniform(1.0, 3.0))
+                            for _ in range(count)])
             
     def add_anxiety_sparks(self, x, y, count=8):
         """Add anxiety spark particles around player"""
+        rand = self.random
+        spawned = []
         for _ in range(count):
-            angle = random.uniform(0, 6.28)  # 0 to 2π
-            distance = random.uniform(20, 40)
-            particle = {
-                "x": x + distance * math.cos(angle),
-                "y": y + distance * math.sin(angle),
-                "vx": random.uniform(-20, 20),
-                "vy": random.uniform(-20, 20),
-                "size": random.randint(2, 5),
-                "color": (255, 255, 0),  # Yellow sparks
-                "life": random.uniform(0.2, 0.5),
-                "type": "anxiety"
-            }
-            self.particles.append(particle)
+            angle = rand.uniform(0, 6.28)  # 0 to 2π
+            distance = rand.uniform(20, 40)
+            spawned.append((x + distance * math.cos(angle), y + distance * math.sin(angle),
+                            rand.uniform(-20, 20), rand.uniform(-20, 20),
+                            rand.randint(2, 5), (255, 255, 0), rand.uniform(0.2, 0.5)))  # Yellow sparks
+        self.emit(ANXIETY, spawned)
             
     def update(self, delta_time):
-        """Update all particles"""
-        # Update existing particles
-        for particle in self.particles[:]:
-            # Update position
-            particle["x"] += particle["vx"] * delta_time
-            particle["y"] += particle["vy"] * delta_time
-            
-            # Apply gravity to some particle types
-            if particle["type"] in ["money", "diploma"]:
-                particle["vy"] += 200 * delta_time  # Gravity
-                
-            # Update life
-            particle["life"] -= delta_time
-            
-            # Remove dead particles
-            if particle["life"] <= 0:
-                self.particles.remove(particle)
+        """Move, pull down and age every particle, then drop the dead ones"""
+        n = self.count
+        if not n:
+            return
+        vy = self.vy[:n]
+        self.x[:n] += self.vx[:n] * delta_time
+        self.y[:n] += vy * delta_time
+        vy += PARTICLE_GRAVITY[self.kind[:n]] * delta_time
+        life = self.life[:n]
+        life -= delta_time
+        dead = life <= 0
+        if dead.any():
+            self.remove(dead)
+
+    def remove(self, mask):
+        """Drop the particles set in `mask` (length count), keeping the rest packed and in order"""
+        n = self.count
+        keep = ~mask
+        kept = int(keep.sum())
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def clear(self):
+        self.count = 0
+
+    def shed_load(self, frame_ms):
+        """Adapt to the last frame's time: over budget, spawn less, cull off-screen and merge tiny particles"""
+        if frame_ms is None:
+            return
+        if frame_ms <= self.frame_budget_ms:
+            self.spawn_scale = min(1.0, self.spawn_scale + 0.05)  # Recover gradually
+            return
+        self.spawn_scale = max(self.MIN_SPAWN_SCALE, self.spawn_scale * 0.8)
+        self.cull_offscreen()
+        self.merge_tiny()
+
+    def cull_offscreen(self):
+        n = self.count
+        if not n:
+            return
+        width, height = self.screen_size
+        x = self.x[:n]
+        y = self.y[:n]
+        pad = self.size[:n] * 2
+        off = (x + pad < 0) | (x - pad > width) | (y + pad < 0) | (y - pad > height)
+        if off.any():
+            self.culled += int(off.sum())
+            self.remove(off)
+
+    def merge_tiny(self):
+        """Collapse tiny particles that share a look and a small cell into one (they overlap on screen)"""
+        n = self.count
+        tiny = np.flatnonzero(self.size[:n] <= self.TINY)
+        if len(tiny) < 2:
+            return
+        cells = np.stack((self.slot[tiny], (self.x[tiny] // self.MERGE_CELL).astype(np.int64),
+                          (self.y[tiny] // self.MERGE_CELL).astype(np.int64)), axis=1)
+        _, first = np.unique(cells, axis=0, return_index=True)
+        if len(first) == len(tiny):
+            return
+        mask = np.zeros(n, dtype=bool)
+        mask[tiny] = True
+        mask[tiny[first]] = False  # Keep one particle per cell
+        self.merged += len(tiny) - len(first)
+        self.remove(mask)
+
+    def stats(self):
+        return {"active": self.count, "budget": self.budget, "high_water": self.high_water,
+                "dropped": self.dropped, "culled": self.culled, "merged": self.merged,
+                "spawn_scale": round(self.spawn_scale, 3)}
                 
+    def get_bounds(self):
+        """Screen rect covering every live particle, or None if there are none"""
+        n = self.count
+        if not n:
+            return None
+        # Money glyphs are 2x size wide and diplomas 1.5x tall; pad for both
+        pad = int(self.size[:n].max()) * 2
+        x = self.x[:n]
+        y = self.y[:n]
+        min_x = float(x.min()) - pad
+        min_y = float(y.min()) - pad
+        max_x = float(x.max()) + pad
+        max_y = float(y.max()) + pad
+        return pygame.Rect(int(min_x), int(min_y), int(max_x - min_x) + 1, int(max_y - min_y) + 1)
+        
+    def commands(self):
+        """(image, pos) blits for every particle's pre-faded atlas image, oldest first"""
+        n = self.count
+        if not n:
+            return []
+        levels = ParticleAtlas.ALPHA_LEVELS
+        # Fade level from remaining life: full alpha from 1s left down to the faintest frame
+        level = np.minimum((self.life[:n] * levels).astype(np.int64), levels - 1)
+        frame = self.slot[:n] * levels + level
+        shift = np.where(PARTICLE_CENTERED[self.kind[:n]], self.size[:n], 0)
+        xs = (self.x[:n] - shift).astype(np.int64).tolist()
+        ys = (self.y[:n] - shift).astype(np.int64).tolist()
+        return list(zip(map(self.atlas.frames.__getitem__, frame.tolist()), zip(xs, ys)))
+
     def draw(self, surface):
-        """Draw all particles"""
-        for particle in self.particles:
-            # Calculate alpha based on remaining life
-            alpha = min(255, int(255 * (particle["life"] / 1.0)))
-            
-            if particle["type"] == "money":
-                # Draw dollar sign
-                font = pygame.font.Font(None, particle["size"] * 2)
-                text = font.render("$", True, particle["color"])
-                text.set_alpha(alpha)
-                surface.blit(text, (particle["x"], particle["y"]))
-            elif particle["type"] == "diploma":
-                # Draw small rectangle for diploma
-                rect = pygame.Surface((particle["size"], particle["size"] * 1.5))
-                rect.fill(particle["color"])
-                rect.set_alpha(alpha)
-                surface.blit(rect, (particle["x"], particle["y"]))
-            else:
-                # Draw circle for other particle types
-                particle_surface = pygame.Surface((particle["size"] * 2, particle["size"] * 2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    particle_surface, 
-                    particle["color"] + (alpha,), 
-                    (particle["size"], particle["size"]), 
-                    particle["size"]
-                )
-                surface.blit(particle_surface, (particle["x"] - particle["size"], particle["y"] - particle["size"]))
+        surface.blits(self.commands(), doreturn=False)
 
 def sector_to_str(sector):
     return sector.name if hasattr(sector, "name") else str(sector)